@@ -5,6 +5,10 @@ Author: Damodar Dahal
 Date: 2025-11-11
 """
 
+import asyncio
+from typing import Dict
+
+from nes.core.models.entity import Entity
 from nes.services.migration.context import MigrationContext
 
 # Migration metadata (used for Git commit message)
@@ -33,6 +37,7 @@ async def migrate(context: MigrationContext) -> None:
         Methods:
             await context.publication.create_entity(entity, author_id, change_description)
             await context.publication.update_entity(entity_id, updates, author_id, change_description)
+            await context.publication.batch_update_entities(entities, author_id, change_description)
             await context.publication.create_relationship(relationship, author_id, change_description)
 
     context.search - SearchService
@@ -215,19 +220,38 @@ async def migrate(context: MigrationContext) -> None:
     wards = await context.search.search_entities(
         entity_type="location", sub_type="ward", limit=10_000
     )
+    wards = [ward for ward in wards if "-" in ward.names[0].en.full]
 
-    for ward in wards:
-        if "-" in ward.names[0].en.full:
-            parent = await context.db.get_entity(ward.parent)
+    # Wards share parents (~9 wards per VDC/municipality), so memoize parent
+    # lookups for the duration of this run. The unique parent set is fetched
+    # up front so concurrent lookups never race on the same key.
+    parent_cache: Dict[str, Entity] = {}
+    semaphore = asyncio.Semaphore(32)
 
-            parent_name = parent.names[0].en.full
-            ward_no = ward.names[0].en.full.split(" ")[-1]
-            ward_name = f"{parent_name} - Ward {ward_no}"
+    async def get_parent(parent_id: str) -> Entity:
+        if parent_id not in parent_cache:
+            async with semaphore:
+                parent_cache[parent_id] = await context.db.get_entity(parent_id)
+        return parent_cache[parent_id]
 
-            ward.names[0].en.full = ward_name
+    await asyncio.gather(*(get_parent(pid) for pid in {w.parent for w in wards}))
 
-            await context.publication.update_entity(
-                entity=ward, author_id=author_id, change_description="Fix ward name"
-            )
+    for ward in wards:
+        parent_name = (await get_parent(ward.parent)).names[0].en.full
+        name = ward.names[0]
+        ward_no = name.en.full.split(" ")[-1]
+        # Names are immutable values; replace rather than edit in place
+        ward.names[0] = name.model_copy(
+            update={
+                "en": name.en.model_copy(
+                    update={"full": f"{parent_name} - Ward {ward_no}"}
+                )
+            }
+        )
+
+    await context.publication.batch_update_entities(
+        entities=wards, author_id=author_id, change_description="Fix ward name"
+    )
 
+    context.log(f"Fixed {len(wards)} ward names")
     context.log("Migration completed")
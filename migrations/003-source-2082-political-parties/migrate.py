@@ -6,20 +6,10 @@ Date: 2025-11-11
 """
 
 from datetime import date
+from functools import lru_cache
 
 from nepali_date_utils import converter
 
-from nes.core.models import (
-    Address,
-    Attribution,
-    Contact,
-    ExternalIdentifier,
-    LangText,
-    LangTextValue,
-    Name,
-    NameParts,
-    PartySymbol,
-)
 from nes.core.models.base import NameKind
 from nes.core.models.entity import EntitySubType, EntityType
 from nes.core.models.version import Author
@@ -43,6 +33,13 @@ CHANGE_DESCRIPTION = "Initial sourcing"
 
 name_extractor = NameExtractor()
 
+
+@lru_cache(maxsize=8192)
+def standardize_name(name: str) -> str:
+    """Memoized NameExtractor.standardize_name; party names repeat heavily."""
+    return name_extractor.standardize_name(name)
+
+
 PARTY_ADDITIONAL_NAME_MAP = {
     "जनता समाजवादी पार्टी, नेपाल": "जनता समाजवादी पार्टी, नेपाल",
     "खम्बुवान राष्ट्रिय मोर्चा नेपाल": "खम्बुवान राष्ट्रिय मोर्चा, नेपाल",
@@ -76,28 +73,53 @@ PARTY_ADDITIONAL_NAME_MAP = {
 
 # Reverse map: corrected name -> original name
 PARTY_ADDITIONAL_NAME_MAP_REVERSE = {
-    name_extractor.standardize_name(v): name_extractor.standardize_name(k)
+    standardize_name(v): standardize_name(k)
     for k, v in PARTY_ADDITIONAL_NAME_MAP.items()
 }
 
 
+# Devanagari digits to ASCII; dates in the source CSV are digits and dashes only
+DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+
+@lru_cache(maxsize=4096)
 def convert_nepali_date(date_str: str) -> date:
-    """Convert Nepali date to date object."""
-    date_roman = transliterate_to_roman(date_str)
-    y, m, d = date_roman.split("-")
-    date_bs = f"{y.zfill(4)}/{m.zfill(2)}/{d.zfill(2)}"
-    date_ad = converter.bs_to_ad(date_bs)
-    y, m, d = date_ad.split("/")
-    return date(int(y), int(m), int(d))
-
-
-reg_no_external_identifier = LangText(
-    en=LangTextValue(
-        value="Election Commission Registration Number (2082)", provenance="human"
-    ),
-    ne=LangTextValue(value="निर्वाचन आयोग दर्ता नं.", provenance="human"),
+    """Convert Nepali date to date object (registration dates repeat often)."""
+    y, m, d = map(int, date_str.translate(DEVANAGARI_DIGITS).split("-"))
+    date_ad = converter.bs_to_ad(f"{y:04d}/{m:02d}/{d:02d}")
+    return date(*map(int, date_ad.split("/")))
+
+
+def lang_text(
+    en_value: str,
+    ne_value: str,
+    en_provenance: str = "human",
+    ne_provenance: str = "human",
+) -> dict:
+    """Build a LangText payload as a plain dict.
+
+    Entity data is validated once by create_entity, so building (and dumping)
+    intermediate Pydantic models per field would only repeat that work.
+    """
+    return {
+        "en": {"value": en_value, "provenance": en_provenance},
+        "ne": {"value": ne_value, "provenance": ne_provenance},
+    }
+
+
+reg_no_external_identifier = lang_text(
+    "Election Commission Registration Number (2082)", "निर्वाचन आयोग दर्ता नं."
 )
 
+# Every party shares the same source attribution, which only depends on DATE
+NEC_ATTRIBUTION = {
+    "title": lang_text("Nepal Election Commission", "नेपाल निर्वाचन आयोग"),
+    "details": lang_text(
+        f"Registered Parties (2082) - imported {DATE}",
+        f"दर्ता भएका दलहरू (२०८२) - आयात मिति {DATE} A.D.",
+    ),
+}
+
 
 async def migrate(context: MigrationContext) -> None:
     """
@@ -117,13 +139,14 @@ async def migrate(context: MigrationContext) -> None:
     party_data = context.read_json("source/parties-data-en.json")
     context.log(f"Loaded {len(party_data)} parties from parties-data-en.json")
 
-    # Load raw CSV for registration info
-    raw_data = context.read_csv("source/parties-2082.csv", delimiter="|")
-
-    # Create lookup by Nepali name
-    raw_lookup = {row["दलको नाम"]: row for row in raw_data}
+    # Stream raw CSV for registration info into a lookup by Nepali name
+    raw_lookup = {
+        row["दलको नाम"]: row
+        for row in context.iter_csv("source/parties-2082.csv", delimiter="|")
+    }
 
-    count = 0
+    # Build every party up front; creation is then a single batched call
+    parties_data = []
     for name_ne, translated in party_data.items():
         raw_row = raw_lookup.get(name_ne)
         if not raw_row:
@@ -135,30 +158,28 @@ async def migrate(context: MigrationContext) -> None:
         reg_no = raw_row.get("दर्ता नं.")
         if reg_no:
             identifiers = [
-                ExternalIdentifier(
-                    scheme="other",
-                    name=reg_no_external_identifier,
-                    value=transliterate_to_roman(reg_no),
-                )
+                {
+                    "scheme": "other",
+                    "name": reg_no_external_identifier,
+                    "value": transliterate_to_roman(reg_no),
+                }
             ]
 
         # Build address
         address = None
         if translated.get("address"):
-            address = Address(
-                description=f"{translated['address']} / {raw_row.get('दलको मुख्य कार्यालय (ठेगाना)', '')}"
-            )
+            address = {
+                "description": f"{translated['address']} / {raw_row.get('दलको मुख्य कार्यालय (ठेगाना)', '')}"
+            }
 
         # Build party_chief
         party_chief = None
         if translated.get("main_person"):
-            party_chief = LangText(
-                en=LangTextValue(
-                    value=translated["main_person"], provenance="translation_service"
-                ),
-                ne=LangTextValue(
-                    value=raw_row.get("प्रमुख पदाधिकारीको नाम", ""), provenance="imported"
-                ),
+            party_chief = lang_text(
+                translated["main_person"],
+                raw_row.get("प्रमुख पदाधिकारीको नाम", ""),
+                en_provenance="translation_service",
+                ne_provenance="imported",
             )
 
         # Build registration_date
@@ -169,94 +190,69 @@ async def migrate(context: MigrationContext) -> None:
         # Build symbol
         symbol = None
         if translated.get("symbol_name"):
-            symbol = PartySymbol(
-                name=LangText(
-                    en=LangTextValue(
-                        value=translated["symbol_name"],
-                        provenance="translation_service",
-                    ),
-                    ne=LangTextValue(
-                        value=raw_row.get("चिन्हको नाम", ""), provenance="imported"
-                    ),
+            symbol = {
+                "name": lang_text(
+                    translated["symbol_name"],
+                    raw_row.get("चिन्हको नाम", ""),
+                    en_provenance="translation_service",
+                    ne_provenance="imported",
                 )
-            )
+            }
 
         # Build contacts
         contacts = None
         if translated.get("contact"):
             contacts = [
-                Contact(type="PHONE", value=normalize_nepali_phone_number(phone))
+                {"type": "PHONE", "value": normalize_nepali_phone_number(phone)}
                 for phone in translated["contact"]
                 if phone
             ]
 
-        name_ne = name_extractor.standardize_name(name_ne)
+        name_ne = standardize_name(name_ne)
+        name_en = standardize_name(translated["name"])
         # Build names (primary + additional if found in reverse map)
         names = [
-            Name(
-                kind=NameKind.PRIMARY,
-                en=NameParts(full=name_extractor.standardize_name(translated["name"])),
-                ne=NameParts(full=name_ne),
-            ).model_dump()
+            {
+                "kind": NameKind.PRIMARY,
+                "en": {"full": name_en},
+                "ne": {"full": name_ne},
+            }
         ]
         if name_ne in PARTY_ADDITIONAL_NAME_MAP_REVERSE:
             original_name = PARTY_ADDITIONAL_NAME_MAP_REVERSE[name_ne]
-            names.append(
-                Name(
-                    kind=NameKind.ALTERNATE,
-                    ne=NameParts(full=original_name),
-                ).model_dump()
-            )
+            names.append({"kind": NameKind.ALTERNATE, "ne": {"full": original_name}})
 
         # Create entity
-        party_data = dict(
+        entity_data = dict(
+            type=EntityType.ORGANIZATION,
+            sub_type=EntitySubType.POLITICAL_PARTY,
             slug=text_to_slug(translated["name"]),
             names=names,
-            attributions=[
-                Attribution(
-                    title=LangText(
-                        en=LangTextValue(
-                            value="Nepal Election Commission", provenance="human"
-                        ),
-                        ne=LangTextValue(value="नेपाल निर्वाचन आयोग", provenance="human"),
-                    ),
-                    details=LangText(
-                        en=LangTextValue(
-                            value=f"Registered Parties (2082) - imported {DATE}",
-                            provenance="human",
-                        ),
-                        ne=LangTextValue(
-                            value=f"दर्ता भएका दलहरू (२०८२) - आयात मिति {DATE} A.D.",
-                            provenance="human",
-                        ),
-                    ),
-                )
-            ],
+            attributions=[NEC_ATTRIBUTION],
             identifiers=identifiers,
             contacts=contacts,
-            address=address.model_dump() if address else None,
-            party_chief=party_chief.model_dump() if party_chief else None,
+            address=address,
+            party_chief=party_chief,
             registration_date=registration_date,
-            symbol=symbol.model_dump() if symbol else None,
-        )
-
-        party = await context.publication.create_entity(
-            entity_type=EntityType.ORGANIZATION,
-            entity_subtype=EntitySubType.POLITICAL_PARTY,
-            entity_data=party_data,
-            author_id=author_id,
-            change_description=CHANGE_DESCRIPTION,
+            symbol=symbol,
         )
-        context.log(f"Created party {party.id}")
 
-        count += 1
+        parties_data.append(entity_data)
 
-    context.log(f"Created {count} political parties")
+    parties = await context.publication.batch_create_entities(
+        entities_data=parties_data,
+        author_id=author_id,
+        change_description=CHANGE_DESCRIPTION,
+    )
+    created_ids = [party.id for party in parties]
+    context.log(
+        f"Created {len(created_ids)} political parties; sample: {created_ids[:5]}"
+    )
 
     # Verify
-    entities = await context.db.list_entities(
-        limit=1000, entity_type="organization", sub_type="political_party"
+    count = await context.db.count_entities(
+        entity_type="organization", sub_type="political_party"
     )
-    context.log(f"Verified: {len(entities)} political_party entities in database")
+    context.log(f"Verified: {count} political_party entities in database")
 
     context.log("Migration completed successfully")
@@ -318,13 +318,13 @@ class CandidateMigration:
                     ne=NameParts(
                         full=self.name_extractor.standardize_name(raw["CandidateName"])
                     ),
-                ).model_dump()
+                )
             ],
             attributes=attributes,
             attributions=[self._build_attribution()],
-            personal_details=personal_details.model_dump(),
+            personal_details=personal_details,
             identifiers=[self._build_identifier(candidate_id)],
-            electoral_details=electoral_details.model_dump(),
+            electoral_details=electoral_details,
             pictures=[self._build_picture(candidate_id)],
         )
 
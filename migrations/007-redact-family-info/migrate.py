@@ -28,46 +28,31 @@ async def migrate(context: MigrationContext) -> None:
     # Author ID for this migration
     author_id = "author:damodar-dahal"
 
-    # Get all person entities from the database (with high limit for 7000+ persons)
-    persons = await context.search.search_entities(entity_type="person", limit=10_000)
-    context.log(f"Found {len(persons)} person entities")
-
-    # Track statistics
-    updated_count = 0
-    skipped_count = 0
-
-    # Process each person entity
+    # Only fetch persons that actually carry family info; the filter is
+    # applied by the database before entities are deserialized
+    persons = await context.search.search_entities(
+        entity_type="person",
+        has_any_field=[
+            "personal_details.spouse_name",
+            "personal_details.mother_name",
+            "personal_details.father_name",
+        ],
+        limit=10_000,
+    )
+    context.log(f"Found {len(persons)} person entities with family information")
+
+    # Redact each person in memory; persistence happens in one batch below
     for person in persons:
-        # Check if person has personal_details
-        if not person.personal_details:
-            skipped_count += 1
-            continue
-
-        # Check if any family fields are set
-        has_family_info = (
-            person.personal_details.spouse_name is not None
-            or person.personal_details.mother_name is not None
-            or person.personal_details.father_name is not None
-        )
-
-        if not has_family_info:
-            skipped_count += 1
-            continue
-
-        # Truncate family fields
         person.personal_details.spouse_name = None
         person.personal_details.mother_name = None
         person.personal_details.father_name = None
 
-        # Update the entity using the publication service
-        await context.publication.update_entity(
-            entity=person,
-            author_id=author_id,
-            change_description="Redact family information for privacy",
-        )
-
-        updated_count += 1
+    # Update the entities using the publication service (one version each)
+    await context.publication.batch_update_entities(
+        entities=persons,
+        author_id=author_id,
+        change_description="Redact family information for privacy",
+    )
 
-    context.log(f"Updated {updated_count} person entities")
-    context.log(f"Skipped {skipped_count} person entities (no family info)")
+    context.log(f"Updated {len(persons)} person entities")
     context.log("Migration completed successfully")
@@ -37,10 +37,13 @@ CHANGE_DESCRIPTION = "Import additional political parties"
 name_extractor = NameExtractor()
 
 
+# Devanagari digits to ASCII; source dates are digits and slashes only
+DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+
 def convert_nepali_date(date_str: str) -> date:
     """Convert Nepali date to date object."""
-    date_roman = transliterate_to_roman(date_str)
-    y, m, d = date_roman.split("/")
+    y, m, d = date_str.translate(DEVANAGARI_DIGITS).split("/")
     date_bs = f"{y.zfill(4)}/{m.zfill(2)}/{d.zfill(2)}"
     date_ad = converter.bs_to_ad(date_bs)
     y, m, d = date_ad.split("/")
@@ -200,7 +203,7 @@ async def migrate(context: MigrationContext) -> None:
                 kind=NameKind.PRIMARY,
                 en=NameParts(full=name_extractor.standardize_name(translated["name"])),
                 ne=NameParts(full=name_ne),
-            ).model_dump()
+            )
         ]
 
         # Create party data structure
@@ -228,10 +231,10 @@ async def migrate(context: MigrationContext) -> None:
                 )
             ],
             identifiers=identifiers,
-            address=address.model_dump() if address else None,
-            party_chief=party_chief.model_dump() if party_chief else None,
+            address=address,
+            party_chief=party_chief,
             registration_date=registration_date,
-            symbol=symbol.model_dump() if symbol else None,
+            symbol=symbol,
         )
 
         parties_to_create.append(
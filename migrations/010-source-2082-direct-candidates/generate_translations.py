@@ -9,9 +9,11 @@ as per migration 007-redact-family-info policy.
 """
 
 import asyncio
+import hashlib
 import json
 import os
 from pathlib import Path
+from typing import Any, Dict, List
 
 from dotenv import load_dotenv
 from pydantic import BaseModel, ConfigDict, Field
@@ -59,11 +61,27 @@ If a field is empty, use an empty string.
 DO NOT include or translate family information (father, mother, spouse names) as this is not collected.
 """
 
+# Response schema; built once since it is the same for every request
+CANDIDATE_SCHEMA = CandidateTranslation.model_json_schema()
 
-async def translate_candidate(
-    provider: GoogleVertexAIProvider, candidate: dict
-) -> dict:
-    """Translate a single candidate's data from Nepali to English."""
+# Number of translation workers (requests kept in flight at once)
+MAX_CONCURRENCY = 24
+
+
+def read_json(path: Path) -> Any:
+    """Read a JSON file (BOM tolerant)."""
+    with open(path, "r", encoding="utf-8-sig") as f:
+        return json.load(f)
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Write pretty-printed UTF-8 JSON."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+
+
+def build_candidate_payload(candidate: dict) -> dict:
+    """Build the translation input for a candidate (no family information)."""
 
     # Clean party name - remove "(एकल चुनाव चिन्ह)" suffix
     party_name = candidate.get("PoliticalPartyName", "")
@@ -74,26 +92,39 @@ async def translate_candidate(
     def safe_str(value):
         return value if value is not None else ""
 
-    # Create input model (NO family information)
-    candidate_data = CandidateTranslation(
-        name=safe_str(candidate.get("CandidateName", "")),
-        address=safe_str(candidate.get("ADDRESS", "")),
-        party_name=safe_str(party_name),
-        experience=safe_str(candidate.get("EXPERIENCE", "")),
-        qualification=safe_str(candidate.get("QUALIFICATION", "")),
-        other_details=safe_str(candidate.get("OTHERDETAILS", "")),
-        symbol_name=safe_str(candidate.get("SymbolName", "")),
-    ).model_dump()
-
-    candidate_data["experience"] = safe_str(candidate.get("EXPERIENCE"))
-    candidate_data["qualification"] = safe_str(candidate.get("QUALIFICATION"))
-    candidate_data["other_details"] = safe_str(candidate.get("OTHERDETAILS"))
-    candidate_data["institution_name"] = safe_str(candidate.get("NAMEOFINST"))
+    # Plain input dict (NO family information); CandidateTranslation describes
+    # the output, so the input is not validated against it
+    return {
+        "name": safe_str(candidate.get("CandidateName")),
+        "address": safe_str(candidate.get("ADDRESS")),
+        "party_name": safe_str(party_name),
+        "experience": safe_str(candidate.get("EXPERIENCE")),
+        "qualification": safe_str(candidate.get("QUALIFICATION")),
+        "other_details": safe_str(candidate.get("OTHERDETAILS")),
+        "symbol_name": safe_str(candidate.get("SymbolName")),
+        "institution_name": safe_str(candidate.get("NAMEOFINST")),
+    }
+
+
+def payload_key(candidate_data: dict) -> str:
+    """Content hash of a translation payload, used to deduplicate requests."""
+    encoded = json.dumps(candidate_data, sort_keys=True, ensure_ascii=False).encode()
+    return hashlib.blake2b(encoded, digest_size=16).hexdigest()
+
+
+async def translate_candidate(
+    provider: GoogleVertexAIProvider, candidate: dict
+) -> dict:
+    """Translate a single candidate's data from Nepali to English."""
+    candidate_data = build_candidate_payload(candidate)
+
+    # Compact JSON keeps the prompt (and input token count) small
+    payload = json.dumps(candidate_data, ensure_ascii=False, separators=(",", ":"))
 
     # Extract structured translation
     result = await provider.extract_structured_data(
-        f"Translate this: {candidate_data}",
-        CandidateTranslation.model_json_schema(),
+        f"Translate this: {payload}",
+        CANDIDATE_SCHEMA,
         instructions=INSTRUCTIONS,
     )
 
@@ -117,46 +148,122 @@ async def main():
         project_id=project_id,
         model_id="gemini-2.5-flash",
         temperature=0.3,
+        max_concurrency=MAX_CONCURRENCY,
     )
 
     print("Loading raw candidate data...")
 
     # Read raw JSON file (2082 direct election only)
-    with open(
-        script_dir / "DirectElectionResultCentral2082.json", "r", encoding="utf-8-sig"
-    ) as f:
-        all_candidates = json.load(f)
+    all_candidates = read_json(script_dir / "DirectElectionResultCentral2082.json")
 
     print(f"Found {len(all_candidates)} candidates to translate")
 
     # Load existing translations if any
     output_file = script_dir / "translations.json"
+    journal_file = script_dir / "translations.jsonl"
     translations = {}
     if output_file.exists():
-        with open(output_file, "r", encoding="utf-8") as f:
-            translations = json.load(f)
+        translations = read_json(output_file)
         print(f"Loaded {len(translations)} existing translations")
 
-    # Translate each candidate
-    for i, candidate in enumerate(all_candidates, 1):
-        candidate_id = str(candidate["CandidateID"])
-
-        if candidate_id in translations:
-            print(
-                f"[{i}/{len(all_candidates)}] Skipping (already translated): {candidate['CandidateName']}"
-            )
-            continue
-
-        print(f"[{i}/{len(all_candidates)}] Translating: {candidate['CandidateName']}")
-        translated = await translate_candidate(provider, candidate)
-        translations[candidate_id] = translated
-        print(f"  ✓ {translated.get('name', 'N/A')}")
+    # Recover translations journaled by an interrupted run
+    if journal_file.exists():
+        recovered = 0
+        with open(journal_file, "r", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    translations.update(json.loads(line))
+                    recovered += 1
+        print(f"Recovered {recovered} translations from {journal_file.name}")
+
+    pending = [
+        candidate
+        for candidate in all_candidates
+        if str(candidate["CandidateID"]) not in translations
+    ]
+    print(
+        f"Translating {len(pending)} candidates "
+        f"({len(all_candidates) - len(pending)} already translated)"
+    )
 
-        # Save after each translation
-        with open(output_file, "w", encoding="utf-8") as f:
-            json.dump(translations, f, ensure_ascii=False, indent=2)
+    # Candidates with identical payloads share one request instead of
+    # paying for the same tokens repeatedly.
+    groups: Dict[str, List[dict]] = {}
+    for candidate in pending:
+        key = payload_key(build_candidate_payload(candidate))
+        groups.setdefault(key, []).append(candidate)
+    if len(groups) < len(pending):
+        print(f"Deduplicated to {len(groups)} unique translation requests")
+
+    # Translations are independent, network-bound RPCs: MAX_CONCURRENCY
+    # workers pull requests off a queue, so a slow call only occupies its own
+    # worker, while a single writer records results as they arrive.
+    work: asyncio.Queue = asyncio.Queue()
+    for group in groups.values():
+        work.put_nowait(group)
+    results: asyncio.Queue = asyncio.Queue()
+
+    async def worker() -> None:
+        while True:
+            group = await work.get()
+            try:
+                translated = await translate_candidate(provider, group[0])
+            except Exception as e:
+                translated = e
+            results.put_nowait((group, translated))
+            work.task_done()
+
+    # Journal each result as one JSONL line so progress survives a crash
+    # without rewriting the whole translations.json per candidate. A failed
+    # request is logged and skipped rather than aborting the run, so results
+    # already paid for are kept and a re-run only retries the failures.
+    failed = 0
+
+    async def save_loop() -> None:
+        nonlocal failed
+        done = 0
+        with open(journal_file, "a", encoding="utf-8") as journal:
+            for _ in range(len(groups)):
+                group, translated = await results.get()
+                if isinstance(translated, Exception):
+                    for candidate in group:
+                        done += 1
+                        failed += 1
+                        print(
+                            f"[{done}/{len(pending)}] {candidate['CandidateName']}"
+                            f" ✗ {translated}"
+                        )
+                    continue
+                for candidate in group:
+                    done += 1
+                    candidate_id = str(candidate["CandidateID"])
+                    translations[candidate_id] = translated
+                    journal.write(
+                        json.dumps({candidate_id: translated}, ensure_ascii=False)
+                        + "\n"
+                    )
+                    print(
+                        f"[{done}/{len(pending)}] {candidate['CandidateName']}"
+                        f" ✓ {translated.get('name', 'N/A')}"
+                    )
+                journal.flush()
+
+    workers = [asyncio.create_task(worker()) for _ in range(MAX_CONCURRENCY)]
+    try:
+        await save_loop()
+    finally:
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+        await provider.aclose()
+
+    # Write the final translations.json once; the journal is then redundant
+    write_json(output_file, translations)
+    journal_file.unlink(missing_ok=True)
 
     print(f"\n✓ Completed: {len(translations)} translations in {output_file}")
+    if failed:
+        print(f"✗ {failed} candidates failed to translate; re-run to retry them")
 
     # Print token usage
     usage = provider.get_token_usage()
@@ -5,11 +5,18 @@ Author: Damodar Dahal
 Date: 2026-01-27
 """
 
+import asyncio
 import csv
+import re
+from collections import Counter
 from datetime import date
+from functools import lru_cache
+from itertools import batched
+from typing import NamedTuple, Optional
 
 from nepali_date_utils import converter
 
+from nes.core.identifiers import build_entity_id
 from nes.core.models import (
     Address,
     Attribution,
@@ -17,25 +24,21 @@ from nes.core.models import (
     EntityPictureType,
     ExternalIdentifier,
     LangText,
-    LangTextValue,
     Name,
     NameParts,
     PartySymbol,
+    make_lang_text,
 )
 from nes.core.models.base import NameKind
 from nes.core.models.entity import EntitySubType, EntityType
 from nes.core.models.person import (
     Candidacy,
-    Education,
     ElectionPosition,
     ElectionSymbol,
     ElectionType,
     ElectoralDetails,
     Gender,
-    PersonDetails,
-    Position,
 )
-from nes.core.utils.devanagari import transliterate_to_roman
 from nes.core.utils.slug_helper import text_to_slug
 from nes.services.migration.context import MigrationContext
 from nes.services.scraping.normalization import NameExtractor
@@ -50,24 +53,103 @@ CHANGE_DESCRIPTION = "2082 Election - Political Party Updates"
 
 AUTHOR_ID = "author:damodar-dahal"
 
+# Number of entities submitted per publication batch call
+BATCH_SIZE = 500
+
+# Maximum number of individual publication calls in flight at once
+MAX_CONCURRENCY = 16
+
+# Identifier name written by migration 005 for 2079 NEC candidate IDs
+NEC_KEY = "nec_candidate_id"
+
+# Tag carried by every 2082 federal election candidate
+CANDIDATE_TAG = "federal-election-2082-candidate"
+
+# Political party IDs are this prefix followed by the party slug
+PARTY_ID_PREFIX = "entity:organization/political_party/"
+
 name_extractor = NameExtractor()
 
 
+# Devanagari digits to ASCII; source dates are digits and slashes only
+DEVANAGARI_DIGITS = str.maketrans("०१२३४५६७८९", "0123456789")
+
+
+@lru_cache(maxsize=4096)
 def convert_nepali_date(date_str: str) -> date:
-    """Convert Nepali date to date object."""
-    date_roman = transliterate_to_roman(date_str)
-    y, m, d = date_roman.split("/")
-    date_bs = f"{y.zfill(4)}/{m.zfill(2)}/{d.zfill(2)}"
-    date_ad = converter.bs_to_ad(date_bs)
-    y, m, d = date_ad.split("/")
-    return date(int(y), int(m), int(d))
-
-
-reg_no_external_identifier = LangText(
-    en=LangTextValue(
-        value="Election Commission Registration Number (2082)", provenance="human"
+    """Convert Nepali date to date object (memoized; dates repeat often)."""
+    y, m, d = map(int, date_str.translate(DEVANAGARI_DIGITS).split("/"))
+    date_ad = converter.bs_to_ad(f"{y:04d}/{m:02d}/{d:02d}")
+    return date(*map(int, date_ad.split("/")))
+
+
+@lru_cache(maxsize=8192)
+def standardize_name(name: str) -> str:
+    """Standardize a name (memoized)."""
+    return name_extractor.standardize_name(name)
+
+
+# Party names are Devanagari, so standardizing them only needs the
+# independent-symbol suffix removed and whitespace collapsed
+_PARTY_SUFFIX_RE = re.compile(r"\(एकल चुनाव चिन्ह\)")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+
+@lru_cache(maxsize=4096)
+def standardize_party_name(name: str) -> str:
+    """Canonical party name used as the party-to-slug lookup key (memoized)."""
+    return _WHITESPACE_RE.sub(" ", _PARTY_SUFFIX_RE.sub("", name)).strip()
+
+
+reg_no_external_identifier = make_lang_text(
+    "Election Commission Registration Number (2082)",
+    "निर्वाचन आयोग दर्ता नं.",
+    "human",
+    "human",
+)
+
+nec_candidate_id_external_identifier = make_lang_text(
+    NEC_KEY, "निर्वाचन आयोग दर्ता नं०", "human", "human"
+)
+
+# Attributions are the same for every created entity, so they are built and
+# dumped once rather than per party / candidate
+PARTY_ATTRIBUTION = Attribution(
+    title=make_lang_text(
+        "Nepal Election Commission", "नेपाल निर्वाचन आयोग", "human", "human"
+    ),
+    details=make_lang_text(
+        f"Registered Parties (2082) - imported {DATE}",
+        f"दर्ता भएका दलहरू (२०८२) - आयात मिति {DATE} A.D.",
+        "human",
+        "human",
+    ),
+).model_dump()
+
+CANDIDATE_ATTRIBUTION = Attribution(
+    title=make_lang_text(
+        "Nepal Election Commission - 2082 candidates",
+        "नेपाल निर्वाचन आयोग - २०८२ को उम्मेदवार",
+        "human",
+        "human",
+    ),
+    details=make_lang_text(
+        f"2082 Election Candidates - imported {DATE}",
+        f"२०८२ निर्वाचन उम्मेदवार - आयात मिति {DATE} A.D.",
+        "human",
+        "human",
     ),
-    ne=LangTextValue(value="निर्वाचन आयोग दर्ता नं.", provenance="human"),
+).model_dump()
+
+# Candidate pictures only differ by URL, so each one is an (unvalidated) copy
+# of this template with the URL filled in
+CANDIDATE_PICTURE_URL_PREFIX = (
+    "https://assets.nes.newnepal.org/assets/images/election-commission-2082-pictures/"
+)
+CANDIDATE_PICTURE = EntityPicture(
+    type=EntityPictureType.THUMB,
+    url="",
+    description="Source: Nepal Election Commission",
 )
 
 
@@ -89,7 +171,7 @@ async def fix_political_parties(context: MigrationContext) -> None:
     # STAGE 1: Create new political parties
     context.log("Stage 1: Creating new political parties...")
     new_parties = party_updates["new_parties"]
-    created_count = 0
+    new_parties_data = []
 
     for party_data in new_parties:
         # Build identifiers
@@ -103,23 +185,20 @@ async def fix_political_parties(context: MigrationContext) -> None:
 
         # Build address
         address = Address(
-            description2=LangText(
-                en=LangTextValue(
-                    value=party_data["address_english"],
-                    provenance="translation_service",
-                ),
-                ne=LangTextValue(
-                    value=party_data["address_nepali"], provenance="imported"
-                ),
+            description2=make_lang_text(
+                party_data["address_english"],
+                party_data["address_nepali"],
+                "translation_service",
+                "imported",
             )
         )
 
         # Build party_chief
-        party_chief = LangText(
-            en=LangTextValue(
-                value=party_data["chief_english"], provenance="translation_service"
-            ),
-            ne=LangTextValue(value=party_data["chief"], provenance="imported"),
+        party_chief = make_lang_text(
+            party_data["chief_english"],
+            party_data["chief"],
+            "translation_service",
+            "imported",
         )
 
         # Build registration_date
@@ -127,14 +206,11 @@ async def fix_political_parties(context: MigrationContext) -> None:
 
         # Build symbol
         symbol = PartySymbol(
-            name=LangText(
-                en=LangTextValue(
-                    value=party_data["symbol_name_english"],
-                    provenance="translation_service",
-                ),
-                ne=LangTextValue(
-                    value=party_data["symbol_name_nepali"], provenance="imported"
-                ),
+            name=make_lang_text(
+                party_data["symbol_name_english"],
+                party_data["symbol_name_nepali"],
+                "translation_service",
+                "imported",
             )
         )
 
@@ -144,7 +220,7 @@ async def fix_political_parties(context: MigrationContext) -> None:
                 kind=NameKind.PRIMARY,
                 en=NameParts(full=party_data["english_name"]),
                 ne=NameParts(full=party_data["nepali_name"]),
-            ).model_dump()
+            )
         ]
 
         # Build picture (logo)
@@ -157,75 +233,60 @@ async def fix_political_parties(context: MigrationContext) -> None:
 
         # Create party entity
         party_entity_data = {
+            "type": EntityType.ORGANIZATION,
+            "sub_type": EntitySubType.POLITICAL_PARTY,
             "slug": party_data["slug"],
             "names": names,
             "pictures": [picture],
-            "attributions": [
-                Attribution(
-                    title=LangText(
-                        en=LangTextValue(
-                            value="Nepal Election Commission", provenance="human"
-                        ),
-                        ne=LangTextValue(value="नेपाल निर्वाचन आयोग", provenance="human"),
-                    ),
-                    details=LangText(
-                        en=LangTextValue(
-                            value=f"Registered Parties (2082) - imported {DATE}",
-                            provenance="human",
-                        ),
-                        ne=LangTextValue(
-                            value=f"दर्ता भएका दलहरू (२०८२) - आयात मिति {DATE} A.D.",
-                            provenance="human",
-                        ),
-                    ),
-                )
-            ],
+            "attributions": [PARTY_ATTRIBUTION],
             "identifiers": identifiers,
-            "address": address.model_dump(),
-            "party_chief": party_chief.model_dump(),
+            "address": address,
+            "party_chief": party_chief,
             "registration_date": registration_date,
-            "symbol": symbol.model_dump(),
+            "symbol": symbol,
         }
 
-        # Create the entity
-        party_entity = await context.publication.create_entity(
-            entity_type=EntityType.ORGANIZATION,
-            entity_subtype=EntitySubType.POLITICAL_PARTY,
-            entity_data=party_entity_data,
-            author_id=AUTHOR_ID,
-            change_description=CHANGE_DESCRIPTION,
-        )
+        new_parties_data.append(party_entity_data)
 
+    # Create the entities
+    await context.publication.batch_create_entities(
+        entities_data=new_parties_data,
+        author_id=AUTHOR_ID,
+        change_description=CHANGE_DESCRIPTION,
+    )
+    for party_data in new_parties:
         context.log(
             f"✓ Created party: {party_data['english_name']} ({party_data['slug']})"
         )
-        created_count += 1
 
-    context.log(f"Stage 1 complete: Created {created_count} new political parties")
+    context.log(f"Stage 1 complete: Created {len(new_parties)} new political parties")
 
     # STAGE 2: Fix existing party names
     context.log("Stage 2: Fixing existing party names...")
     existing_fixes = party_updates["existing_parties_fixes"]
-    updated_count = 0
 
-    for fix in existing_fixes:
+    # Get the parties by slug
+    party_entities = await asyncio.gather(
+        *(
+            context.db.get_entity(f"{PARTY_ID_PREFIX}{fix['slug']}")
+            for fix in existing_fixes
+        )
+    )
+
+    fixed_parties = []
+    for fix, party_entity in zip(existing_fixes, party_entities):
         slug = fix["slug"]
         corrected_nepali_name = fix["corrected_nepali_name"]
         corrected_english_name = fix.get("corrected_english_name")
         fix_type = fix["type"]
 
-        # Get the party by slug
-        party_id = f"entity:organization/political_party/{slug}"
-        party_entity = await context.db.get_entity(party_id)
-
         if not party_entity:
             context.log(f"⚠ Party not found: {slug}")
             continue
 
         # Get current primary name
-        current_nepali_name = (
-            party_entity.names[0].ne.full if party_entity.names[0].ne else None
-        )
+        primary = party_entity.names[0]
+        current_nepali_name = primary.ne.full if primary.ne else None
 
         if fix_type == "misspelled_name":
             # Update primary name with corrected version
@@ -235,10 +296,10 @@ async def fix_political_parties(context: MigrationContext) -> None:
                     en=(
                         NameParts(full=corrected_english_name)
                         if corrected_english_name
-                        else party_entity.names[0].en
+                        else primary.en
                     ),
                     ne=NameParts(full=corrected_nepali_name),
-                ).model_dump()
+                )
             ]
 
             # Preserve other existing names (skip the first one and any that match corrected name)
@@ -273,10 +334,10 @@ async def fix_political_parties(context: MigrationContext) -> None:
                     en=(
                         NameParts(full=corrected_english_name)
                         if corrected_english_name
-                        else party_entity.names[0].en
+                        else primary.en
                     ),
                     ne=NameParts(full=corrected_nepali_name),
-                ).model_dump()
+                )
             ]
 
             # Add current name as alternate if it's different from corrected
@@ -286,7 +347,7 @@ async def fix_political_parties(context: MigrationContext) -> None:
                         kind=NameKind.ALTERNATE,
                         en=None,
                         ne=NameParts(full=current_nepali_name),
-                    ).model_dump()
+                    )
                 )
 
             # Preserve other existing names (skip the first one and any that match corrected or current name)
@@ -302,122 +363,183 @@ async def fix_political_parties(context: MigrationContext) -> None:
 
             party_entity.names = updated_names
 
-        # Update the entity
-        await context.publication.update_entity(
-            entity=party_entity,
-            author_id=AUTHOR_ID,
-            change_description=f"Fix party name: {current_nepali_name} → {corrected_nepali_name}",
+        fixed_parties.append(
+            (party_entity, slug, current_nepali_name, corrected_nepali_name)
         )
 
-        context.log(
-            f"✓ Fixed party name ({slug}): {current_nepali_name} → {corrected_nepali_name}"
+    # Update the entities; each fix carries its own change description
+    semaphore = asyncio.Semaphore(MAX_CONCURRENCY)
+
+    async def update_party(party_entity, current_name, corrected_name) -> None:
+        async with semaphore:
+            await context.publication.update_entity(
+                entity=party_entity,
+                author_id=AUTHOR_ID,
+                change_description=f"Fix party name: {current_name} → {corrected_name}",
+            )
+
+    await asyncio.gather(
+        *(
+            update_party(party_entity, current_name, corrected_name)
+            for party_entity, _, current_name, corrected_name in fixed_parties
         )
-        updated_count += 1
+    )
+    for _, slug, current_name, corrected_name in fixed_parties:
+        context.log(f"✓ Fixed party name ({slug}): {current_name} → {corrected_name}")
 
-    context.log(f"Stage 2 complete: Fixed {updated_count} existing party names")
+    context.log(f"Stage 2 complete: Fixed {len(fixed_parties)} existing party names")
     context.log("fix_political_parties completed successfully")
 
 
-async def import_candidates(context: MigrationContext) -> None:
+class CandidateSources(NamedTuple):
+    """Source data for the candidate import, read from the migration folder."""
+
+    candidate_translations: dict
+    candidate_lookup: dict
+    id_matches: dict
+    district_slug_map: dict
+    party_to_slug: dict
+
+
+def load_candidate_sources(context: MigrationContext) -> CandidateSources:
+    """Read and index the candidate source files.
+
+    Touches no database state, so it can run in a worker thread while
+    fix_political_parties is in flight.
+    """
+    data_dir = context.migration_dir / "data"
+
+    candidate_translations = context.read_json("data/translations.json")
+
+    raw_candidates = context.read_json("data/DirectElectionResultCentral2082.json")
+    candidate_lookup = {c["CandidateID"]: c for c in raw_candidates}
+
+    # Candidate ID matches (2079 -> 2082)
+    with open(data_dir / "candidate_id_matches_2079_2082.csv", "r", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        i_2082, i_2079 = header.index("y_2082"), header.index("y_2079")
+        id_matches = {int(row[i_2082]): int(row[i_2079]) for row in reader}
+
+    with open(
+        data_dir / "district-to-slug.csv", "r", encoding="utf-8", newline=""
+    ) as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        i_district, i_slug = header.index("district"), header.index("slug")
+        district_slug_map = {row[i_district]: row[i_slug] for row in reader}
+
+    with open(data_dir / "party-to-slug.csv", "r", encoding="utf-8", newline="") as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        i_party, i_slug = header.index("party"), header.index("slug")
+        party_to_slug = {
+            standardize_party_name(row[i_party]): row[i_slug] for row in reader
+        }
+
+    return CandidateSources(
+        candidate_translations,
+        candidate_lookup,
+        id_matches,
+        district_slug_map,
+        party_to_slug,
+    )
+
+
+async def import_candidates(
+    context: MigrationContext, sources: Optional[CandidateSources] = None
+) -> None:
     """
     Import 2082 direct election candidates.
 
     This function:
-    1. Loads all existing person entities into memory
-    2. Loads candidate ID matches from 2079 to 2082
+    1. Loads the candidate source data (unless already loaded)
+    2. Loads the persons matched from 2079 to 2082
     3. For existing candidates: updates electoral history
     4. For new candidates: creates new person entities
     5. Ensures no slug collisions
     """
     context.log("Starting import_candidates...")
 
-    # Load translations
-    candidate_translations = context.read_json("data/translations.json")
+    if sources is None:
+        sources = load_candidate_sources(context)
+    (
+        candidate_translations,
+        candidate_lookup,
+        id_matches,
+        district_slug_map,
+        party_to_slug,
+    ) = sources
     context.log(f"Loaded {len(candidate_translations)} candidate translations")
-
-    # Load raw candidate data
-    raw_candidates = context.read_json("data/DirectElectionResultCentral2082.json")
-    candidate_lookup = {c["CandidateID"]: c for c in raw_candidates}
-    context.log(f"Loaded {len(raw_candidates)} raw candidates")
-
-    # Load candidate ID matches (2079 -> 2082)
-    id_matches = {}
-    with open(
-        context.migration_dir / "data" / "candidate_id_matches_2079_2082.csv", "r"
-    ) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            id_matches[int(row["y_2082"])] = int(row["y_2079"])
+    context.log(f"Loaded {len(candidate_lookup)} raw candidates")
     context.log(f"Loaded {len(id_matches)} candidate ID matches")
-
-    # Load district slug mapping
-    district_slug_map = {}
-    with open(
-        context.migration_dir / "data" / "district-to-slug.csv", "r", encoding="utf-8"
-    ) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            district_slug_map[row["district"]] = row["slug"]
     context.log(f"Loaded {len(district_slug_map)} district mappings")
+    context.log(f"Loaded {len(party_to_slug)} party-to-slug mappings")
 
-    # Load all existing person entities into memory
-    context.log("Loading all person entities into memory...")
-    all_persons = await context.db.list_entities(
-        entity_type="person", sub_type=None, limit=100_000
+    # Load only the persons carrying a matched 2079 NEC ID (filtered on the
+    # raw identifier values, so the rest are never parsed), and all political
+    # parties for linking; the two reads are independent
+    context.log("Loading matched person entities...")
+    matched_persons, parties = await asyncio.gather(
+        context.db.search_entities(
+            entity_type="person",
+            identifier_values=[str(v) for v in id_matches.values()],
+            limit=100_000,
+        ),
+        context.db.list_entities(
+            entity_type="organization", sub_type="political_party", limit=1000
+        ),
     )
-    context.log(f"Loaded {len(all_persons)} person entities")
+    context.log(f"Loaded {len(matched_persons)} matched person entities")
 
     # Build lookup by NEC candidate ID
-    person_by_nec_id = {}
-    for person in all_persons:
-        if person.identifiers:
-            for identifier in person.identifiers:
-                if (
-                    identifier.name
-                    and identifier.name.en
-                    and "nec_candidate_id" in identifier.name.en.value.lower()
-                ):
-                    person_by_nec_id[int(identifier.value)] = person
-                    break
+    person_by_nec_id = {
+        int(identifier.value): person
+        for person in matched_persons
+        for identifier in person.identifiers or ()
+        if identifier.name
+        and identifier.name.en
+        and NEC_KEY in identifier.name.en.value
+    }
     context.log(f"Built lookup for {len(person_by_nec_id)} persons with NEC IDs")
 
-    # Load party name to slug mapping
-    context.log("Loading party-to-slug mapping...")
-    party_to_slug = {}
-    with open(
-        context.migration_dir / "data/party-to-slug.csv", "r", encoding="utf-8"
-    ) as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            party_name = row["party"]
-            slug = row["slug"]
-            standardized = name_extractor.standardize_name(party_name)
-            party_to_slug[standardized] = slug
-    context.log(f"Loaded {len(party_to_slug)} party-to-slug mappings")
-
-    # Load all political parties for linking (by slug)
-    parties = await context.db.list_entities(
-        entity_type="organization", sub_type="political_party", limit=1000
-    )
-    party_lookup = {}
-    for party in parties:
-        # Extract slug from party ID (format: entity:organization/political_party/{slug})
-        if party.id.startswith("entity:organization/political_party/"):
-            slug = party.id.replace("entity:organization/political_party/", "")
-            party_lookup[slug] = party.id
+    # Index political parties for linking (by slug)
+    prefix_len = len(PARTY_ID_PREFIX)
+    party_lookup = {
+        party.id[prefix_len:]: party.id
+        for party in parties
+        if party.id.startswith(PARTY_ID_PREFIX)
+    }
     context.log(f"Loaded {len(party_lookup)} political parties for linking")
 
     # Process candidates
     new_candidates = []
     updated_candidates = []
 
-    for candidate_id_str, translated in candidate_translations.items():
-        candidate_id_2082 = int(candidate_id_str)
-        raw = candidate_lookup.get(candidate_id_2082)
+    # Drop translations without raw data up front, so the loop below only
+    # sees candidates it can import
+    translated_candidates = [
+        (int(candidate_id_str), translated)
+        for candidate_id_str, translated in candidate_translations.items()
+    ]
+    missing_raw = [
+        candidate_id
+        for candidate_id, _ in translated_candidates
+        if candidate_id not in candidate_lookup
+    ]
+    if missing_raw:
+        context.log(
+            f"WARNING: No raw data for {len(missing_raw)} candidate IDs: "
+            f"{', '.join(map(str, missing_raw))}"
+        )
+        translated_candidates = [
+            (candidate_id, translated)
+            for candidate_id, translated in translated_candidates
+            if candidate_id in candidate_lookup
+        ]
 
-        if not raw:
-            context.log(f"WARNING: No raw data for candidate ID {candidate_id_2082}")
-            continue
+    for candidate_id_2082, translated in translated_candidates:
+        raw = candidate_lookup[candidate_id_2082]
 
         # Check if this candidate exists from 2079
         candidate_id_2079 = id_matches.get(candidate_id_2082)
@@ -433,8 +555,20 @@ async def import_candidates(context: MigrationContext) -> None:
     context.log(f"Found {len(updated_candidates)} existing candidates to update")
     context.log(f"Found {len(new_candidates)} new candidates to create")
 
-    # Update existing candidates
+    # Fail before any writes if a party or district has no mapping
+    _validate_mappings(
+        [raw for _, raw, _, _ in updated_candidates]
+        + [raw for raw, _, _ in new_candidates],
+        party_to_slug,
+        party_lookup,
+        district_slug_map,
+    )
+
+    # Add the 2082 candidacies first. Two 2082 candidate IDs can map to the
+    # same 2079 person, so collect each person once; concurrent updates of
+    # the same entity would race on its version number.
     context.log("Updating existing candidates with 2082 electoral history...")
+    persons_to_update = {}
     for person, raw, translated, candidate_id_2082 in updated_candidates:
         # Add new candidacy to electoral details
         party_id = _get_party_id(raw, party_to_slug, party_lookup, district_slug_map)
@@ -456,88 +590,128 @@ async def import_candidates(context: MigrationContext) -> None:
 
         # Update electoral details
         if person.electoral_details:
-            # Create a new list with existing candidacies plus the new one
-            updated_candidacies = list(person.electoral_details.candidacies) + [
-                new_candidacy
-            ]
-            person.electoral_details = ElectoralDetails(candidacies=updated_candidacies)
+            # Existing candidacies are already valid; append in place
+            # rather than copying and re-validating the whole history
+            person.electoral_details.candidacies.append(new_candidacy)
         else:
             person.electoral_details = ElectoralDetails(candidacies=[new_candidacy])
 
         # Update tags
-        if "federal-election-2082-candidate" not in person.tags:
-            person.tags.append("federal-election-2082-candidate")
+        if CANDIDATE_TAG not in person.tags:
+            person.tags.append(CANDIDATE_TAG)
 
-        # Update entity
-        await context.publication.update_entity(
-            entity=person,
-            author_id=AUTHOR_ID,
-            change_description=f"Added 2082 election candidacy",
-        )
+        persons_to_update[person.id] = person
 
-        context.log(
-            f"✓ Updated: {person.names[0].ne.full if person.names[0].ne else person.names[0].en.full}"
+    # Then save them, one batch at a time
+    for batch in batched(list(persons_to_update.values()), BATCH_SIZE):
+        persons = await context.publication.batch_update_entities(
+            entities=list(batch),
+            author_id=AUTHOR_ID,
+            change_description="Added 2082 election candidacy",
         )
+        for person in persons:
+            context.log(f"✓ Updated: {_display_name(person)}")
 
     context.log(f"Updated {len(updated_candidates)} existing candidates")
 
     # Create new candidates
     context.log("Creating new candidate entities...")
 
-    # Build person data for all new candidates
-    person_data_list = []
-    for raw, translated, candidate_id_2082 in new_candidates:
-        person_data = _build_person_data(
-            candidate_id_2082,
-            raw,
-            translated,
-            party_to_slug,
-            party_lookup,
-            district_slug_map,
-        )
-        person_data_list.append(person_data)
+    # Resolve final slugs first; only the slugs are needed to detect
+    # collisions, so the full person payloads are built per batch below
+    slugs = [text_to_slug(translated["name"]) for _, translated, _ in new_candidates]
 
-    # Check for slug collisions with existing entities
-    existing_slugs = {p.slug for p in all_persons}
-    for person_data in person_data_list:
-        if person_data["slug"] in existing_slugs:
-            person_data["slug"] = f"{person_data['slug']}-{person_data['candidate_id']}"
+    # Check for slug collisions with existing entities by ID, rather than
+    # loading every person just to collect their slugs
+    existing = await asyncio.gather(
+        *(context.db.get_entity(build_entity_id("person", None, s)) for s in slugs)
+    )
+    for i, existing_person in enumerate(existing):
+        if existing_person is not None:
+            slugs[i] = f"{slugs[i]}-{new_candidates[i][2]}"
 
     # Check for duplicate slugs within new candidates
-    slugs = [p["slug"] for p in person_data_list]
-    duplicate_slugs = [s for s in set(slugs) if slugs.count(s) > 1]
+    slug_counts = Counter(slugs)
+    duplicate_slugs = {s for s, count in slug_counts.items() if count > 1}
     if duplicate_slugs:
         context.log(
             f"Found {len(duplicate_slugs)} duplicate slugs, adding candidate ID suffix"
         )
         context.log(f"Duplicate slugs: {', '.join(sorted(duplicate_slugs))}")
-        for person_data in person_data_list:
-            if person_data["slug"] in duplicate_slugs:
-                old_slug = person_data["slug"]
-                person_data["slug"] = (
-                    f"{person_data['slug']}-{person_data['candidate_id']}"
+        for i, slug in enumerate(slugs):
+            if slug in duplicate_slugs:
+                slugs[i] = f"{slug}-{new_candidates[i][2]}"
+                context.log(f"  Renamed: {slug} → {slugs[i]}")
+
+    # Build and create entities one batch at a time
+    for batch in batched(zip(new_candidates, slugs), BATCH_SIZE):
+        persons = await context.publication.batch_create_entities(
+            entities_data=[
+                _build_person_data(
+                    candidate_id_2082,
+                    slug,
+                    raw,
+                    translated,
+                    party_to_slug,
+                    party_lookup,
+                    district_slug_map,
                 )
-                context.log(f"  Renamed: {old_slug} → {person_data['slug']}")
-
-    # Create entities
-    for person_data in person_data_list:
-        del person_data["candidate_id"]
-
-        person = await context.publication.create_entity(
-            entity_type=EntityType.PERSON,
-            entity_subtype=None,
-            entity_data=person_data,
+                for (raw, translated, candidate_id_2082), slug in batch
+            ],
             author_id=AUTHOR_ID,
             change_description=CHANGE_DESCRIPTION,
         )
-        context.log(
-            f"✓ Created: {person.names[0].ne.full if person.names[0].ne else person.names[0].en.full}"
-        )
+        for person in persons:
+            context.log(f"✓ Created: {_display_name(person)}")
 
-    context.log(f"Created {len(person_data_list)} new person entities")
+    context.log(f"Created {len(new_candidates)} new person entities")
     context.log("import_candidates completed successfully")
 
 
+def _display_name(entity) -> str:
+    """Primary name of an entity for logging, preferring Nepali."""
+    primary = entity.names[0]
+    return primary.ne.full if primary.ne else primary.en.full
+
+
+def _validate_mappings(
+    raw_candidates: list,
+    party_to_slug: dict,
+    party_lookup: dict,
+    district_slug_map: dict,
+) -> None:
+    """Check every distinct party and district of the candidates is mapped.
+
+    Raises once with all missing names, so a bad mapping is caught before
+    any entity is written instead of partway through the import.
+    """
+    party_names = {
+        standardize_party_name(raw["PoliticalPartyName"])
+        for raw in raw_candidates
+        if raw.get("PoliticalPartyName") and raw["PoliticalPartyName"] != "स्वतन्त्र"
+    }
+    missing_parties = sorted(party_names - party_to_slug.keys())
+    if missing_parties:
+        raise Exception(
+            f"No slug mapping found for parties: {', '.join(missing_parties)}\n"
+            f"Add these parties to data/party-to-slug.csv"
+        )
+
+    missing_slugs = sorted(
+        {party_to_slug[name] for name in party_names} - party_lookup.keys()
+    )
+    if missing_slugs:
+        raise Exception(f"No party entity found with slugs: {', '.join(missing_slugs)}")
+
+    missing_districts = sorted(
+        {raw["DistrictName"] for raw in raw_candidates} - district_slug_map.keys()
+    )
+    if missing_districts:
+        raise Exception(
+            f"No slug mapping for districts: {', '.join(missing_districts)}"
+        )
+
+
 def _get_party_id(
     raw: dict, party_to_slug: dict, party_lookup: dict, district_slug_map: dict
 ) -> str | None:
@@ -546,9 +720,7 @@ def _get_party_id(
     if not party_name or party_name == "स्वतन्त्र":
         return None
 
-    # Clean party name
-    party_name = party_name.replace("(एकल चुनाव चिन्ह)", "").strip()
-    standardized = name_extractor.standardize_name(party_name)
+    standardized = standardize_party_name(party_name)
 
     # Look up slug from CSV mapping
     if standardized not in party_to_slug:
@@ -565,7 +737,7 @@ def _get_party_id(
         raise Exception(
             f"No party entity found with slug: {slug}\n"
             f"Party name: {party_name}\n"
-            f"Expected entity ID: entity:organization/political_party/{slug}"
+            f"Expected entity ID: {PARTY_ID_PREFIX}{slug}"
         )
 
     return party_lookup[slug]
@@ -591,20 +763,43 @@ def _build_symbol(raw: dict, translated: dict) -> ElectionSymbol | None:
     symbol_en = (translated.get("symbol_name") or "").strip() or None
 
     return ElectionSymbol(
-        symbol_name=LangText(
-            en=(
-                LangTextValue(value=symbol_en, provenance="translation_service")
-                if symbol_en
-                else None
-            ),
-            ne=LangTextValue(value=raw["SymbolName"], provenance="imported"),
+        # Symbols recur across candidates, so their names are shared
+        symbol_name=make_lang_text(
+            symbol_en, raw["SymbolName"], "translation_service", "imported"
         ),
         nec_id=int(raw["SYMBOLCODE"]),
     )
 
 
+# Text fields of a candidate read by _build_person_data
+_TRANSLATED_KEYS = (
+    "address",
+    "education_institution",
+    "education_level",
+    "education_field",
+    "position_title",
+    "organization",
+    "description",
+    "qualification",
+    "other_details",
+)
+_RAW_KEYS = ("ADDRESS", "NAMEOFINST", "QUALIFICATION", "OTHERDETAILS")
+
+
+def _pick(
+    en: str | None = None,
+    ne: str | None = None,
+    en_provenance: str = "translation_service",
+) -> LangText | None:
+    """make_lang_text for candidate text, or None when both values are empty."""
+    if not (en or ne):
+        return None
+    return make_lang_text(en, ne, en_provenance, "imported")
+
+
 def _build_person_data(
     candidate_id: int,
+    slug: str,
     raw: dict,
     translated: dict,
     party_to_slug: dict,
@@ -619,98 +814,51 @@ def _build_person_data(
     gender_map = {"पुरुष": Gender.MALE, "महिला": Gender.FEMALE}
     gender = gender_map.get(raw.get("Gender", ""), Gender.OTHER)
 
-    # Address
-    addr_en = (translated.get("address") or "").strip() or None
-    addr_ne = (raw.get("ADDRESS") or "").strip() or None
+    # Stripped text fields, with empty values normalized to None
+    tr = {k: (translated.get(k) or "").strip() or None for k in _TRANSLATED_KEYS}
+    rw = {k: (raw.get(k) or "").strip() or None for k in _RAW_KEYS}
 
     # Education
     education = None
-    inst_en = (translated.get("education_institution") or "").strip() or None
-    inst_ne = (raw.get("NAMEOFINST") or "").strip() or None
-    degree_en = (translated.get("education_level") or "").strip() or None
-    field_en = (translated.get("education_field") or "").strip() or None
-
-    if inst_en or inst_ne or degree_en or field_en:
+    if (
+        tr["education_institution"]
+        or rw["NAMEOFINST"]
+        or tr["education_level"]
+        or tr["education_field"]
+    ):
         education = [
-            Education(
-                institution=(
-                    LangText(
-                        en=(
-                            LangTextValue(
-                                value=inst_en, provenance="translation_service"
-                            )
-                            if inst_en
-                            else None
-                        ),
-                        ne=(
-                            LangTextValue(value=inst_ne, provenance="imported")
-                            if inst_ne
-                            else None
-                        ),
-                    )
-                    if inst_en or inst_ne
-                    else LangText()
+            {
+                "institution": make_lang_text(
+                    tr["education_institution"],
+                    rw["NAMEOFINST"],
+                    "translation_service",
+                    "imported",
                 ),
-                degree=(
-                    LangText(en=LangTextValue(value=degree_en, provenance="llm"))
-                    if degree_en
-                    else None
-                ),
-                field=(
-                    LangText(en=LangTextValue(value=field_en, provenance="llm"))
-                    if field_en
-                    else None
-                ),
-            )
+                "degree": _pick(tr["education_level"], en_provenance="llm"),
+                "field": _pick(tr["education_field"], en_provenance="llm"),
+            }
         ]
 
     # Positions
     positions = None
-    title_en = (translated.get("position_title") or "").strip() or None
-    org_en = (translated.get("organization") or "").strip() or None
-    desc_en = (translated.get("description") or "").strip() or None
-
-    if title_en or org_en:
+    if tr["position_title"] or tr["organization"]:
         positions = [
-            Position(
-                title=(
-                    LangText(en=LangTextValue(value=title_en, provenance="llm"))
-                    if title_en
-                    else LangText()
-                ),
-                organization=(
-                    LangText(en=LangTextValue(value=org_en, provenance="llm"))
-                    if org_en
-                    else None
-                ),
-                description=desc_en[:200] if desc_en else None,
-            )
+            {
+                "title": make_lang_text(tr["position_title"], None, "llm"),
+                "organization": _pick(tr["organization"], en_provenance="llm"),
+                "description": (tr["description"][:200] if tr["description"] else None),
+            }
         ]
 
-    personal_details = PersonDetails(
-        birth_date=None,
-        gender=gender,
-        address=(
-            Address(
-                description2=LangText(
-                    en=(
-                        LangTextValue(value=addr_en, provenance="translation_service")
-                        if addr_en
-                        else None
-                    ),
-                    ne=(
-                        LangTextValue(value=addr_ne, provenance="imported")
-                        if addr_ne
-                        else None
-                    ),
-                )
-            )
-            if addr_en or addr_ne
-            else None
-        ),
-        education=education,
-        positions=positions,
-    )
+    # Plain dicts; the whole entity is validated once when it is created
+    address = _pick(tr["address"], rw["ADDRESS"])
+    personal_details = {
+        "birth_date": None,
+        "gender": gender,
+        "address": {"description2": address} if address else None,
+        "education": education,
+        "positions": positions,
+    }
 
     # Electoral details
     party_id = _get_party_id(raw, party_to_slug, party_lookup, district_slug_map)
@@ -732,118 +880,49 @@ def _build_person_data(
 
     electoral_details = ElectoralDetails(candidacies=[candidacy])
 
-    # Attributes
-    qual_en = (translated.get("qualification") or "").strip() or None
-    qual_ne = (raw.get("QUALIFICATION") or "").strip() or None
-    other_en = (translated.get("other_details") or "").strip() or None
-    other_ne = (raw.get("OTHERDETAILS") or "").strip() or None
-
     # Age attribute
     age_text = None
     if age and isinstance(age, int):
-        age_text = LangText(
-            en=LangTextValue(
-                value=f"Aged {age} as of January 2026", provenance="imported"
-            ),
-            ne=LangTextValue(value=f"२०८२ माघमा {age} वर्ष", provenance="imported"),
-        ).model_dump()
+        age_text = make_lang_text(
+            f"Aged {age} as of January 2026",
+            f"२०८२ माघमा {age} वर्ष",
+            "imported",
+            "imported",
+        )
 
     attributes = {
         "election_council_misc": {
             "age": age_text,
-            "qualification": (
-                LangText(
-                    en=(
-                        LangTextValue(value=qual_en, provenance="translation_service")
-                        if qual_en
-                        else None
-                    ),
-                    ne=(
-                        LangTextValue(value=qual_ne, provenance="imported")
-                        if qual_ne
-                        else None
-                    ),
-                ).model_dump()
-                if qual_en or qual_ne
-                else None
-            ),
-            "other_details": (
-                LangText(
-                    en=(
-                        LangTextValue(value=other_en, provenance="translation_service")
-                        if other_en
-                        else None
-                    ),
-                    ne=(
-                        LangTextValue(value=other_ne, provenance="imported")
-                        if other_ne
-                        else None
-                    ),
-                ).model_dump()
-                if other_en or other_ne
-                else None
-            ),
+            "qualification": _pick(tr["qualification"], rw["QUALIFICATION"]),
+            "other_details": _pick(tr["other_details"], rw["OTHERDETAILS"]),
         }
     }
 
-    # Build slug
-    slug = text_to_slug(translated["name"])
-
     return {
+        "type": EntityType.PERSON,
         "slug": slug,
-        "candidate_id": candidate_id,
-        "tags": ["federal-election-2082-candidate"],
+        "tags": [CANDIDATE_TAG],
         "names": [
             Name(
                 kind=NameKind.PRIMARY,
-                en=NameParts(full=name_extractor.standardize_name(translated["name"])),
-                ne=NameParts(
-                    full=name_extractor.standardize_name(raw["CandidateName"])
-                ),
-            ).model_dump()
-        ],
-        "attributes": attributes,
-        "attributions": [
-            Attribution(
-                title=LangText(
-                    en=LangTextValue(
-                        value="Nepal Election Commission - 2082 candidates",
-                        provenance="human",
-                    ),
-                    ne=LangTextValue(
-                        value="नेपाल निर्वाचन आयोग - २०८२ को उम्मेदवार",
-                        provenance="human",
-                    ),
-                ),
-                details=LangText(
-                    en=LangTextValue(
-                        value=f"2082 Election Candidates - imported {DATE}",
-                        provenance="human",
-                    ),
-                    ne=LangTextValue(
-                        value=f"२०८२ निर्वाचन उम्मेदवार - आयात मिति {DATE} A.D.",
-                        provenance="human",
-                    ),
-                ),
+                en=NameParts(full=standardize_name(translated["name"])),
+                ne=NameParts(full=standardize_name(raw["CandidateName"])),
             )
         ],
-        "personal_details": personal_details.model_dump(),
+        "attributes": attributes,
+        "attributions": [CANDIDATE_ATTRIBUTION],
+        "personal_details": personal_details,
         "identifiers": [
             ExternalIdentifier(
                 scheme="other",
-                name=LangText(
-                    en=LangTextValue(value="nec_candidate_id", provenance="human"),
-                    ne=LangTextValue(value="निर्वाचन आयोग दर्ता नं०", provenance="human"),
-                ),
+                name=nec_candidate_id_external_identifier,
                 value=str(candidate_id),
             )
         ],
-        "electoral_details": electoral_details.model_dump(),
+        "electoral_details": electoral_details,
         "pictures": [
-            EntityPicture(
-                type=EntityPictureType.THUMB,
-                url=f"https://assets.nes.newnepal.org/assets/images/election-commission-2082-pictures/{candidate_id}.jpg",
-                description="Source: Nepal Election Commission",
+            CANDIDATE_PICTURE.model_copy(
+                update={"url": f"{CANDIDATE_PICTURE_URL_PREFIX}{candidate_id}.jpg"}
             )
         ],
     }
@@ -858,10 +937,14 @@ async def migrate(context: MigrationContext) -> None:
     """
     context.log("Migration 010-source-2082-direct-candidates started")
 
-    # Execute step 1: Fix political parties
-    await fix_political_parties(context)
+    # Execute step 1: Fix political parties, reading the candidate source
+    # files in a worker thread meanwhile (they don't depend on the parties)
+    sources, _ = await asyncio.gather(
+        asyncio.to_thread(load_candidate_sources, context),
+        fix_political_parties(context),
+    )
 
-    # Execute step 2: Import candidates
-    await import_candidates(context)
+    # Execute step 2: Import candidates, once the parties are in place
+    await import_candidates(context, sources)
 
     context.log("Migration completed successfully")
@@ -51,7 +51,7 @@ def validate_entity_id(entity_id: str) -> str:
         ValueError: If the entity ID format is invalid
     """
     from nes.core.models.entity import EntitySubType, EntityType
-    from nes.core.models.entity_type_map import ENTITY_TYPE_MAP
+    from nes.core.models.entity_type_map import ENTITY_SUBTYPE_VALUES
 
     try:
         components = break_entity_id(entity_id)
@@ -61,22 +61,20 @@ def validate_entity_id(entity_id: str) -> str:
     # Validate type
     if len(components.type) > MAX_TYPE_LENGTH:
         raise ValueError(f"Entity type too long: {components.type}")
-    if components.type not in EntityType:
+    allowed_subtypes = ENTITY_SUBTYPE_VALUES.get(components.type)
+    if allowed_subtypes is None:
         raise ValueError(f"Unsupported entity type {components.type}.")
 
-    entity_type = EntityType(components.type)
-
-    # Validate subtype if present
-    if components.subtype is not None:
+    # Validate subtype if present; plain string lookups, enums are only
+    # built to report an error
+    if components.subtype is not None and components.subtype not in allowed_subtypes:
         if components.subtype not in EntitySubType:
             raise ValueError(f"Unsupported entity sub type {components.subtype}.")
 
-        entity_subtype = EntitySubType(components.subtype)
-
-        if entity_subtype not in ENTITY_TYPE_MAP[entity_type]:
-            raise ValueError(
-                f"Entity subtype {components.subtype} not supported for entity type {entity_type}."
-            )
+        entity_type = EntityType(components.type)
+        raise ValueError(
+            f"Entity subtype {components.subtype} not supported for entity type {entity_type}."
+        )
 
     # Validate slug
     if len(components.slug) < MIN_SLUG_LENGTH or len(components.slug) > MAX_SLUG_LENGTH:
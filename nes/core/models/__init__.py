@@ -13,6 +13,7 @@ from .base import (
     NameKind,
     NameParts,
     ProvenanceMethod,
+    make_lang_text,
 )
 from .entity import (
     Entity,
@@ -55,6 +56,7 @@ __all__ = [
     "NameKind",
     "NameParts",
     "ProvenanceMethod",
+    "make_lang_text",
     # Entity models
     "Entity",
     "EntitySubType",
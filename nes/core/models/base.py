@@ -1,7 +1,9 @@
 """Base models using Pydantic for nes."""
 
+import re
 from enum import Enum
-from typing import Annotated, Dict, Optional
+from functools import lru_cache
+from typing import Annotated, Callable, Dict, Optional
 
 from pydantic import (
     AnyUrl,
@@ -17,8 +19,17 @@ from pydantic import (
 from nes.core.identifiers.builders import break_entity_id
 from nes.core.identifiers.validators import is_valid_entity_id
 
+# Shared model configs: every model rejects unknown fields, and value
+# models are also immutable
+STRICT_CONFIG = ConfigDict(extra="forbid")
+FROZEN_CONFIG = ConfigDict(extra="forbid", frozen=True)
+
 # E.164 phone number, e.g., "+977123456789"
-E164PhoneStr = constr(pattern=r"^\+[1-9]\d{1,14}$")
+E164_PATTERN = r"^\+[1-9]\d{1,14}$"
+E164PhoneStr = constr(pattern=E164_PATTERN)
+
+_E164_RE = re.compile(E164_PATTERN)
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
 
 class Language(str, Enum):
@@ -38,7 +49,7 @@ class NameKind(str, Enum):
     ALIAS = "ALIAS"
     ALTERNATE = "ALTERNATE"
     BIRTH = "BIRTH_NAME"
-    OFFICIAL = "BIRTH_NAME"
+    OFFICIAL = "OFFICIAL"
 
 
 class NamePart(str, Enum):
@@ -65,14 +76,14 @@ class ProvenanceMethod(str, Enum):
 class LangTextValue(BaseModel):
     """Text with provenance tracking."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     value: str
     provenance: Optional[ProvenanceMethod] = None
 
 
 class LangText(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     en: Optional[LangTextValue] = Field(
         None,
@@ -84,8 +95,34 @@ class LangText(BaseModel):
     )
 
 
+@lru_cache(maxsize=4096)
+def make_lang_text(
+    en: Optional[str] = None,
+    ne: Optional[str] = None,
+    en_provenance: Optional[ProvenanceMethod] = None,
+    ne_provenance: Optional[ProvenanceMethod] = None,
+) -> LangText:
+    """Build a LangText, sharing one instance per distinct text (memoized).
+
+    LangText is frozen, so recurring text (party, symbol and place names)
+    can reuse the same instance instead of allocating a new one each time.
+    """
+    return LangText(
+        en=(
+            LangTextValue(value=en, provenance=en_provenance)
+            if en is not None
+            else None
+        ),
+        ne=(
+            LangTextValue(value=ne, provenance=ne_provenance)
+            if ne is not None
+            else None
+        ),
+    )
+
+
 class CursorPage(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     has_more: bool
     offset: int = 0
@@ -95,7 +132,7 @@ class CursorPage(BaseModel):
 class NameParts(BaseModel):
     """Name parts dictionary."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     full: str
     given: Optional[str] = None
@@ -108,7 +145,7 @@ class NameParts(BaseModel):
 class Name(BaseModel):
     """Represents a name with language and kind classification."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     kind: NameKind = Field(..., description="Type of name")
     en: Optional[NameParts] = Field(None, description="English/romanized name parts")
@@ -139,41 +176,50 @@ class Contact(BaseModel):
     type: ContactType
     value: str
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     @model_validator(mode="after")
     def _validate_value_by_type(self) -> "Contact":
-        import re
-
-        t = self.type
-        v = self.value
-        if t == ContactType.EMAIL:
-            # Simple email validation
-            email_pattern = r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$"
-            if not re.match(email_pattern, v):
-                raise ValueError(f"Invalid email format: {v}")
-        elif t in {
-            ContactType.URL,
-            ContactType.TWITTER,
-            ContactType.FACEBOOK,
-            ContactType.INSTAGRAM,
-            ContactType.LINKEDIN,
-        }:
-            # Validate URL format
-            if not (v.startswith("http://") or v.startswith("https://")):
-                raise ValueError(f"URL must start with http:// or https://: {v}")
-        elif t == ContactType.PHONE or t == ContactType.WHATSAPP:
-            # E.164 phone format
-            if not re.match(r"^\+[1-9]\d{1,14}$", v):
-                raise ValueError("PHONE/WHATSAPP must be E.164 (e.g., +977123456789)")
         # TELEGRAM/WECHAT/OTHER are free-form (usernames/IDs/handles)
+        check = _CONTACT_VALUE_CHECKS.get(self.type)
+        if check is not None:
+            check(self.value)
         return self
 
 
+def _check_email(v: str) -> None:
+    # Simple email validation
+    if not _EMAIL_RE.match(v):
+        raise ValueError(f"Invalid email format: {v}")
+
+
+def _check_url(v: str) -> None:
+    if not v.startswith(("http://", "https://")):
+        raise ValueError(f"URL must start with http:// or https://: {v}")
+
+
+def _check_phone(v: str) -> None:
+    if not _E164_RE.match(v):
+        raise ValueError("PHONE/WHATSAPP must be E.164 (e.g., +977123456789)")
+
+
+# Value check per contact type; types not listed are not checked
+_CONTACT_VALUE_CHECKS: Dict[ContactType, Callable[[str], None]] = {
+    ContactType.EMAIL: _check_email,
+    ContactType.URL: _check_url,
+    ContactType.TWITTER: _check_url,
+    ContactType.FACEBOOK: _check_url,
+    ContactType.INSTAGRAM: _check_url,
+    ContactType.LINKEDIN: _check_url,
+    ContactType.PHONE: _check_phone,
+    ContactType.WHATSAPP: _check_phone,
+}
+
+
 class Address(BaseModel):
     """Address information."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     location_id: Optional[str] = Field(
         None, description="Location identifier"
@@ -212,7 +258,7 @@ class EntityPictureType(str, Enum):
 class EntityPicture(BaseModel):
     """Picture information for an entity."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     type: EntityPictureType = Field(..., description="Picture type")
     url: str = Field(..., description="Picture URL")
@@ -224,7 +270,7 @@ class EntityPicture(BaseModel):
 class Attribution(BaseModel):
     """Attribution with title and details."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     title: LangText = Field(..., description="Attribution title")
     details: Optional[LangText] = Field(..., description="Attribution details")
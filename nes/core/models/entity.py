@@ -8,7 +8,6 @@ from typing import Any, Dict, List, Optional
 from pydantic import (
     AnyUrl,
     BaseModel,
-    ConfigDict,
     Field,
     computed_field,
     field_validator,
@@ -18,7 +17,15 @@ from pydantic import (
 from nes.core.identifiers import build_entity_id
 
 from ..constraints import MAX_SLUG_LENGTH, MIN_SLUG_LENGTH, SLUG_PATTERN
-from .base import Attribution, Contact, EntityPicture, LangText, Name, NameKind
+from .base import (
+    STRICT_CONFIG,
+    Attribution,
+    Contact,
+    EntityPicture,
+    LangText,
+    Name,
+    NameKind,
+)
 from .version import VersionSummary
 
 
@@ -111,7 +118,7 @@ class Entity(BaseModel, ABC):
     At least one name with kind='PRIMARY' should be provided for all entities.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     slug: str = Field(
         ...,
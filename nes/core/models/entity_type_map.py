@@ -4,41 +4,121 @@ This module defines the valid combinations of entity types and subtypes,
 reflecting Nepal's political and administrative structure.
 """
 
+from functools import cache
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping, Optional, Tuple, Type
+
 from nes.core.models.entity import EntitySubType, EntityType
 
+if TYPE_CHECKING:
+    from nes.core.models.entity import Entity
+
 # Entity type map for v2 with Nepali context
-# This maps entity types to their allowed subtypes
-ENTITY_TYPE_MAP = {
-    EntityType.PERSON: {
-        None,  # Person entities do not have subtypes
-        # All persons (politicians, civil servants, activists, etc.) use the same type
-        # Roles and positions are captured in attributes
-    },
-    EntityType.ORGANIZATION: {
-        None,  # Organization without specific subtype
-        EntitySubType.POLITICAL_PARTY,  # Nepali political parties
-        EntitySubType.GOVERNMENT_BODY,  # Government ministries, departments, constitutional bodies
-        EntitySubType.HOSPITAL,  # Hospitals and health facilities
-        EntitySubType.NGO,  # Non-governmental organizations
-        EntitySubType.INTERNATIONAL_ORG,  # International organizations in Nepal
-    },
-    EntityType.LOCATION: {
-        None,  # Location without specific subtype
-        # Nepal's administrative hierarchy (federal structure since 2015)
-        EntitySubType.PROVINCE,  # 7 provinces (प्रदेश)
-        EntitySubType.DISTRICT,  # 77 districts (जिल्ला)
-        EntitySubType.METROPOLITAN_CITY,  # 6 metropolitan cities (महानगरपालिका)
-        EntitySubType.SUB_METROPOLITAN_CITY,  # 11 sub-metropolitan cities (उपमहानगरपालिका)
-        EntitySubType.MUNICIPALITY,  # 276 municipalities (नगरपालिका)
-        EntitySubType.RURAL_MUNICIPALITY,  # 460 rural municipalities (गाउँपालिका)
-        EntitySubType.WARD,  # Wards within municipalities (वडा)
-        EntitySubType.CONSTITUENCY,  # Electoral constituencies (निर्वाचन क्षेत्र)
-    },
-    EntityType.PROJECT: {
-        None,  # Project without specific subtype
-        EntitySubType.DEVELOPMENT_PROJECT,  # Development projects (विकास परियोजना)
-    },
-}
+# This maps entity types to their allowed subtypes (read-only)
+ENTITY_TYPE_MAP = MappingProxyType(
+    {
+        EntityType.PERSON: {
+            None,  # Person entities do not have subtypes
+            # All persons (politicians, civil servants, activists, etc.) use the same type
+            # Roles and positions are captured in attributes
+        },
+        EntityType.ORGANIZATION: {
+            None,  # Organization without specific subtype
+            EntitySubType.POLITICAL_PARTY,  # Nepali political parties
+            EntitySubType.GOVERNMENT_BODY,  # Government ministries, departments, constitutional bodies
+            EntitySubType.HOSPITAL,  # Hospitals and health facilities
+            EntitySubType.NGO,  # Non-governmental organizations
+            EntitySubType.INTERNATIONAL_ORG,  # International organizations in Nepal
+        },
+        EntityType.LOCATION: {
+            None,  # Location without specific subtype
+            # Nepal's administrative hierarchy (federal structure since 2015)
+            EntitySubType.PROVINCE,  # 7 provinces (प्रदेश)
+            EntitySubType.DISTRICT,  # 77 districts (जिल्ला)
+            EntitySubType.METROPOLITAN_CITY,  # 6 metropolitan cities (महानगरपालिका)
+            EntitySubType.SUB_METROPOLITAN_CITY,  # 11 sub-metropolitan cities (उपमहानगरपालिका)
+            EntitySubType.MUNICIPALITY,  # 276 municipalities (नगरपालिका)
+            EntitySubType.RURAL_MUNICIPALITY,  # 460 rural municipalities (गाउँपालिका)
+            EntitySubType.WARD,  # Wards within municipalities (वडा)
+            EntitySubType.CONSTITUENCY,  # Electoral constituencies (निर्वाचन क्षेत्र)
+        },
+        EntityType.PROJECT: {
+            None,  # Project without specific subtype
+            EntitySubType.DEVELOPMENT_PROJECT,  # Development projects (विकास परियोजना)
+        },
+    }
+)
+
+# Allowed subtype values keyed by entity type value, for validating raw
+# entity ID components without constructing enum members
+ENTITY_SUBTYPE_VALUES = MappingProxyType(
+    {
+        entity_type.value: frozenset(
+            subtype.value if subtype else None for subtype in subtypes
+        )
+        for entity_type, subtypes in ENTITY_TYPE_MAP.items()
+    }
+)
+
+
+@cache
+def _entity_class_map() -> Mapping[Tuple[str, Optional[str]], Type["Entity"]]:
+    """Model class for every allowed (type, subtype) pair.
+
+    Flattened so resolving a class is a single lookup. EntityType and
+    EntitySubType are str enums, so raw string pairs such as
+    ("organization", "political_party") match too. The model modules are
+    imported on first use rather than when this module is imported.
+    """
+    from nes.core.models.location import Location
+    from nes.core.models.organization import (
+        GovernmentBody,
+        Hospital,
+        Organization,
+        PoliticalParty,
+    )
+    from nes.core.models.person import Person
+    from nes.core.models.project import Project
+
+    base_classes = {
+        EntityType.PERSON: Person,
+        EntityType.ORGANIZATION: Organization,
+        EntityType.LOCATION: Location,
+        EntityType.PROJECT: Project,
+    }
+    subtype_classes = {
+        EntitySubType.POLITICAL_PARTY: PoliticalParty,
+        EntitySubType.GOVERNMENT_BODY: GovernmentBody,
+        EntitySubType.HOSPITAL: Hospital,
+    }
+    return MappingProxyType(
+        {
+            (entity_type, subtype): subtype_classes.get(
+                subtype, base_classes[entity_type]
+            )
+            for entity_type, subtypes in ENTITY_TYPE_MAP.items()
+            for subtype in subtypes
+        }
+    )
+
+
+def get_entity_class(
+    entity_type: str, entity_subtype: Optional[str] = None
+) -> Type["Entity"]:
+    """Get the model class for an entity type and subtype.
+
+    Subtypes without a dedicated class resolve to the type's base class.
+
+    Raises:
+        ValueError: If the entity type is unknown
+    """
+    entity_classes = _entity_class_map()
+    entity_class = entity_classes.get((entity_type, entity_subtype))
+    if entity_class is None:
+        entity_class = entity_classes.get((entity_type, None))
+        if entity_class is None:
+            raise ValueError(f"Unknown entity type: {entity_type}")
+    return entity_class
 
 
 # Nepali administrative hierarchy documentation
@@ -1,7 +1,7 @@
 """Location-specific models for nes."""
 
 from enum import Enum
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
 
 from pydantic import Field, computed_field
 
@@ -33,6 +33,15 @@ ADMINISTRATIVE_LEVELS = {
     LocationType.CONSTITUENCY.value: None,  # Electoral boundary, not administrative
 }
 
+# Lookups keyed on the entity subtype enum, so the computed fields below
+# (evaluated on every serialization) are a single dict lookup
+_LOCATION_TYPE_BY_SUB_TYPE: Dict[EntitySubType, LocationType] = {
+    EntitySubType(lt.value): lt for lt in LocationType
+}
+_ADMIN_LEVEL_BY_SUB_TYPE: Dict[EntitySubType, Optional[int]] = {
+    EntitySubType(lt.value): ADMINISTRATIVE_LEVELS[lt.value] for lt in LocationType
+}
+
 
 class Location(Entity):
     """Location entity."""
@@ -50,10 +59,10 @@ class Location(Entity):
     @property
     def location_type(self) -> Optional[LocationType]:
         """Type of location from subtype."""
-        return LocationType(self.sub_type.value) if self.sub_type else None
+        return _LOCATION_TYPE_BY_SUB_TYPE.get(self.sub_type)
 
     @computed_field
     @property
     def administrative_level(self) -> Optional[int]:
         """Administrative level in hierarchy."""
-        return ADMINISTRATIVE_LEVELS.get(self.sub_type.value) if self.sub_type else None
+        return _ADMIN_LEVEL_BY_SUB_TYPE.get(self.sub_type)
@@ -4,9 +4,9 @@ from datetime import date
 from enum import Enum
 from typing import List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import BaseModel, Field
 
-from .base import Address, LangText
+from .base import FROZEN_CONFIG, Address, LangText
 from .entity import Entity, EntitySubType
 
 
@@ -37,7 +37,7 @@ class Organization(Entity):
 class PartySymbol(BaseModel):
     """Political party symbol."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     name: LangText = Field(..., description="Symbol name")
 
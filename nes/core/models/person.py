@@ -2,11 +2,11 @@
 
 from datetime import date
 from enum import Enum
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Tuple
 
-from pydantic import AnyUrl, BaseModel, ConfigDict, Field, field_validator
+from pydantic import AnyUrl, BaseModel, Field, field_validator
 
-from .base import Address, LangText
+from .base import FROZEN_CONFIG, STRICT_CONFIG, Address, LangText
 from .entity import Entity
 
 
@@ -43,7 +43,7 @@ class ElectionPosition(str, Enum):
 class Education(BaseModel):
     """Education record for a person."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     institution: LangText = Field(
         ..., description="Name of the educational institution"
@@ -59,7 +59,7 @@ class Education(BaseModel):
 class Position(BaseModel):
     """Position or role held by a person."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = FROZEN_CONFIG
 
     title: LangText = Field(..., description="Job title or position name")
     organization: Optional[LangText] = Field(
@@ -75,7 +75,7 @@ class Position(BaseModel):
 class PersonDetails(BaseModel):
     """Personal details for a person."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     birth_date: Optional[str] = Field(  # "2012", "2012-01", "2012-01-01"
         None, description="Birth date (may be partial, e.g., year only)"
@@ -90,10 +90,12 @@ class PersonDetails(BaseModel):
     mother_name: Optional[LangText] = Field(None, description="Mother's name")
     spouse_name: Optional[LangText] = Field(None, description="Spouse's name")
 
-    education: Optional[List[Education]] = Field(
+    # Tuples: these are only read once a person is built, and Education and
+    # Position are frozen, so the whole history is immutable
+    education: Optional[Tuple[Education, ...]] = Field(
         None, description="Educational background"
     )
-    positions: Optional[List[Position]] = Field(
+    positions: Optional[Tuple[Position, ...]] = Field(
         None, description="Professional positions held"
     )
 
@@ -101,7 +103,7 @@ class PersonDetails(BaseModel):
 class ElectionSymbol(BaseModel):
     """Election symbol information."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     symbol_name: LangText = Field(..., description="Symbol name")
     nec_id: Optional[int] = Field(
@@ -113,7 +115,7 @@ class ElectionSymbol(BaseModel):
 class Candidacy(BaseModel):
     """Electoral candidacy record."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     election_year: int = Field(..., description="Election year")
     election_type: ElectionType = Field(
@@ -152,7 +154,7 @@ class Candidacy(BaseModel):
 class ElectoralDetails(BaseModel):
     """Electoral details for a person."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     candidacies: Optional[List[Candidacy]] = Field(
         None, description="List of electoral candidacies"
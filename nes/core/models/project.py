@@ -21,6 +21,7 @@ from typing import Dict, List, Literal, Optional
 
 from pydantic import AnyUrl, BaseModel, ConfigDict, Field
 
+from .base import STRICT_CONFIG
 from .entity import Entity, EntitySubType
 
 # =============================================================================
@@ -70,7 +71,7 @@ class BudgetType(str, Enum):
 class FinancingTerms(BaseModel):
     """Loan/grant terms - captures DFMIS commitment details."""
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     interest_rate: Optional[float] = Field(None, description="Annual interest rate (%)")
     repayment_period_years: Optional[int] = Field(
@@ -97,7 +98,7 @@ class FinancingCommitment(BaseModel):
     - JICA: May have multiple entries for main/consulting portions
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     # Donor identification
     donor: str = Field(..., description="Donor organization name")
@@ -147,7 +148,7 @@ class ProjectDateEvent(BaseModel):
     - JICA: Date of approval
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     date: date
     type: str = Field(
@@ -173,7 +174,7 @@ class SectorMapping(BaseModel):
     We store both normalized (MoF) and original donor values.
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     normalized_sector: Optional[str] = Field(
         None, description="MoF-normalized sector code or name"
@@ -197,7 +198,7 @@ class CrossCuttingTag(BaseModel):
     - WB: themev2_level1/level2
     """
 
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     category: str = Field(
         ..., description="GENDER, CLIMATE, DISABILITY, SDG, GOVERNANCE, THEME"
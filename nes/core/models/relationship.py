@@ -3,8 +3,9 @@
 from datetime import date, datetime
 from typing import Any, Dict, List, Literal, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from pydantic import BaseModel, Field, computed_field, field_validator
 
+from .base import STRICT_CONFIG
 from .version import VersionSummary
 
 RelationshipType = Literal[
@@ -24,7 +25,7 @@ RelationshipType = Literal[
 
 
 class Relationship(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     source_entity_id: str
     target_entity_id: str
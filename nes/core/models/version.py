@@ -4,11 +4,12 @@ from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, Optional
 
-from pydantic import BaseModel, ConfigDict, Field, computed_field, field_validator
+from pydantic import BaseModel, Field, computed_field, field_validator
 
 from nes.core.identifiers import build_version_id
 
 from ..constraints import MAX_SLUG_LENGTH, MIN_SLUG_LENGTH, SLUG_PATTERN
+from .base import STRICT_CONFIG
 
 
 class Author(BaseModel):
@@ -33,7 +34,7 @@ class VersionType(str, Enum):
 
 
 class VersionSummary(BaseModel):
-    model_config = ConfigDict(extra="forbid")
+    model_config = STRICT_CONFIG
 
     entity_or_relationship_id: str = Field(
         ..., description="ID of the entity or relationship this version belongs to"
@@ -12,6 +12,7 @@ Devanagari Unicode range: U+0900 to U+097F
 
 import re
 import unicodedata
+from functools import lru_cache
 from typing import Optional
 
 # Devanagari Unicode range
@@ -175,11 +176,12 @@ def transliterate_to_devanagari(text: str) -> str:
     return result
 
 
+@lru_cache(maxsize=16384)
 def transliterate_to_roman(text: str) -> str:
     """Transliterate Devanagari text to Roman script.
 
     This provides a basic phonetic mapping from Devanagari to Roman
-    following common Nepali romanization conventions.
+    following common Nepali romanization conventions. Results are memoized.
 
     Args:
         text: Text in Devanagari script
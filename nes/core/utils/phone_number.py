@@ -3,6 +3,8 @@
 import re
 from typing import Optional
 
+_NON_DIGIT_RE = re.compile(r"\D")
+
 
 def normalize_nepali_phone_number(phone: Optional[str]) -> Optional[str]:
     """Normalize Nepali phone numbers to international format.
@@ -26,7 +28,7 @@ def normalize_nepali_phone_number(phone: Optional[str]) -> Optional[str]:
         return None
 
     phone = str(phone).strip()
-    digits = re.sub(r"\D", "", phone)
+    digits = _NON_DIGIT_RE.sub("", phone)
 
     if not digits:
         return None
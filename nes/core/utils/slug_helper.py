@@ -2,11 +2,19 @@
 
 import re
 import unicodedata
+from functools import lru_cache
 
+_WHITESPACE_RE = re.compile(r"[\s_]+")
+_NON_SLUG_RE = re.compile(r"[^a-z0-9-]")
+_HYPHENS_RE = re.compile(r"-+")
 
+
+@lru_cache(maxsize=16384)
 def text_to_slug(text: str) -> str:
     """Convert text to a URL-friendly slug.
 
+    Results are memoized, since migrations slug the same names repeatedly.
+
     Args:
         text: Input text to convert to slug
 
@@ -21,13 +29,13 @@ def text_to_slug(text: str) -> str:
     text = text.lower()
 
     # Replace spaces and underscores with hyphens
-    text = re.sub(r"[\s_]+", "-", text)
+    text = _WHITESPACE_RE.sub("-", text)
 
     # Remove non-alphanumeric characters except hyphens
-    text = re.sub(r"[^a-z0-9-]", "", text)
+    text = _NON_SLUG_RE.sub("", text)
 
     # Remove multiple consecutive hyphens
-    text = re.sub(r"-+", "-", text)
+    text = _HYPHENS_RE.sub("-", text)
 
     # Strip leading/trailing hyphens
     text = text.strip("-")
@@ -6,6 +6,7 @@ and author operations.
 """
 
 from abc import ABC, abstractmethod
+from datetime import datetime
 from typing import Dict, List, Optional, Union
 
 from nes.core.models.entity import Entity
@@ -80,6 +81,25 @@ class EntityDatabase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+        attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
+    ) -> int:
+        """Count entities matching the given filters.
+
+        Args:
+            entity_type: Filter by entity type (person, organization, location)
+            sub_type: Filter by entity subtype
+            attr_filters: Filter by entity attributes (AND logic)
+
+        Returns:
+            Number of entities matching the criteria
+        """
+        pass
+
     @abstractmethod
     async def search_entities(
         self,
@@ -89,6 +109,8 @@ class EntityDatabase(ABC):
         attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
         limit: int = 100,
         offset: int = 0,
+        has_any_field: Optional[List[str]] = None,
+        identifier_values: Optional[List[str]] = None,
     ) -> List[Entity]:
         """Search entities with text query and optional filtering.
 
@@ -103,6 +125,11 @@ class EntityDatabase(ABC):
             attr_filters: Filter by entity attributes (AND logic)
             limit: Maximum number of entities to return
             offset: Number of entities to skip
+            has_any_field: Only include entities where at least one of these
+                dotted field paths (e.g. "personal_details.father_name") is
+                set to a non-null value (OR logic)
+            identifier_values: Only include entities with at least one
+                external identifier whose value is in this list (OR logic)
 
         Returns:
             List of entities matching the search criteria, ranked by relevance
@@ -162,6 +189,15 @@ class EntityDatabase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def count_relationships(self) -> int:
+        """Count all relationships in the database.
+
+        Returns:
+            Total number of relationships
+        """
+        pass
+
     @abstractmethod
     async def put_version(self, version: Version) -> Version:
         """Store a version in the database.
@@ -218,6 +254,37 @@ class EntityDatabase(ABC):
         """
         pass
 
+    @abstractmethod
+    async def list_versions_by_entity(
+        self,
+        entity_or_relationship_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        author_slug: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        min_version: Optional[int] = None,
+        max_version: Optional[int] = None,
+        order: str = "asc",
+    ) -> List[Version]:
+        """List versions for a specific entity or relationship with filtering.
+
+        Args:
+            entity_or_relationship_id: The entity or relationship ID to filter by
+            limit: Maximum number of versions to return
+            offset: Number of versions to skip
+            author_slug: Optional filter by author slug
+            created_after: Optional filter for versions created after this datetime
+            created_before: Optional filter for versions created before this datetime
+            min_version: Optional filter for minimum version number (inclusive)
+            max_version: Optional filter for maximum version number (inclusive)
+            order: Sort order - "asc" (default) or "desc"
+
+        Returns:
+            List of versions matching the criteria, sorted by version number
+        """
+        pass
+
     @abstractmethod
     async def put_author(self, author: Author) -> Author:
         """Store an author in the database.
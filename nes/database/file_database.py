@@ -18,19 +18,10 @@ import logging
 import time
 from datetime import date, datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
-
-from nes.core.models.entity import Entity, EntitySubType, EntityType
-from nes.core.models.entity_type_map import ENTITY_TYPE_MAP
-from nes.core.models.location import Location
-from nes.core.models.organization import (
-    GovernmentBody,
-    Hospital,
-    Organization,
-    PoliticalParty,
-)
-from nes.core.models.person import Person
-from nes.core.models.project import Project
+from typing import Any, Dict, List, Optional, Set, Union
+
+from nes.core.models.entity import Entity
+from nes.core.models.entity_type_map import get_entity_class
 from nes.core.models.relationship import Relationship
 from nes.core.models.version import Author, Version
 
@@ -118,8 +109,7 @@ class FileDatabase(EntityDatabase):
                 return None
 
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 return self._entity_from_dict(data)
             except (json.JSONDecodeError, ValueError, KeyError):
@@ -254,6 +244,22 @@ class FileDatabase(EntityDatabase):
                 indent=2,
             )
 
+    def _read_json_file(self, file_path: Path) -> Any:
+        """Read and parse a JSON file.
+
+        Args:
+            file_path: Path to read from
+
+        Returns:
+            Parsed JSON data
+
+        Raises:
+            OSError: If file read fails
+            json.JSONDecodeError: If the file is not valid JSON
+        """
+        with open(file_path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
     async def get_entity(self, entity_id: str) -> Optional[Entity]:
         """Retrieve an entity by its ID.
 
@@ -292,8 +298,7 @@ class FileDatabase(EntityDatabase):
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json_file(file_path)
 
             return self._entity_from_dict(data)
 
@@ -383,6 +388,41 @@ class FileDatabase(EntityDatabase):
         # Apply pagination
         return entities[offset : offset + limit]
 
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+        attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
+    ) -> int:
+        """Count entities matching the given filters.
+
+        Files are loaded and skipped under the same rules as list_entities,
+        so the count always equals the number of entities it would return.
+
+        Args:
+            entity_type: Filter by entity type (person, organization, location)
+            sub_type: Filter by entity subtype
+            attr_filters: Filter by entity attributes (AND logic)
+
+        Returns:
+            Number of entities matching the criteria
+        """
+        search_path = self._build_entity_search_path(entity_type, sub_type)
+
+        if not search_path.exists():
+            return 0
+
+        count = 0
+        for file_path in search_path.rglob("*.json"):
+            try:
+                if self._load_and_filter_entity(file_path, attr_filters):
+                    count += 1
+            except (json.JSONDecodeError, ValueError, KeyError) as e:
+                logger.warning(f"Skipping invalid entity file {file_path}: {e}")
+                continue
+
+        return count
+
     def _build_entity_search_path(
         self, entity_type: Optional[str] = None, sub_type: Optional[str] = None
     ) -> Path:
@@ -406,12 +446,21 @@ class FileDatabase(EntityDatabase):
         self,
         file_path: Path,
         attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
+        has_any_field: Optional[List[str]] = None,
+        identifier_values: Optional[Set[str]] = None,
     ) -> Optional[Entity]:
         """Load an entity from a file and apply attribute filters.
 
+        Filters are applied to the raw JSON before model validation, so
+        entities that are filtered out are never parsed.
+
         Args:
             file_path: Path to the entity JSON file
             attr_filters: Optional attribute filters to apply
+            has_any_field: Optional dotted field paths, at least one of which
+                must be set
+            identifier_values: Optional identifier values, at least one of
+                which must appear in the entity's identifiers
 
         Returns:
             Entity if it passes filters, None otherwise
@@ -420,8 +469,7 @@ class FileDatabase(EntityDatabase):
             json.JSONDecodeError: If JSON is malformed
             ValueError: If entity data is invalid
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         # Check if this is an entity (has 'type' field)
         if "type" not in data:
@@ -431,6 +479,17 @@ class FileDatabase(EntityDatabase):
         if attr_filters and not self._matches_attribute_filters(data, attr_filters):
             return None
 
+        # Apply field presence filter if provided
+        if has_any_field and not self._has_any_field(data, has_any_field):
+            return None
+
+        # Apply identifier filter if provided
+        if identifier_values and not any(
+            identifier.get("value") in identifier_values
+            for identifier in data.get("identifiers") or []
+        ):
+            return None
+
         # Parse entity
         return self._entity_from_dict(data)
 
@@ -450,6 +509,26 @@ class FileDatabase(EntityDatabase):
         # Check if all filter criteria match (AND logic)
         return all(attributes.get(k) == v for k, v in attr_filters.items())
 
+    def _has_any_field(self, data: dict, field_paths: List[str]) -> bool:
+        """Check if any of the dotted field paths is set in entity data.
+
+        Args:
+            data: Entity data dictionary
+            field_paths: Dotted paths such as "personal_details.father_name"
+
+        Returns:
+            True if at least one path resolves to a non-null value (OR logic)
+        """
+        for field_path in field_paths:
+            value = data
+            for key in field_path.split("."):
+                value = value.get(key) if isinstance(value, dict) else None
+                if value is None:
+                    break
+            if value is not None:
+                return True
+        return False
+
     async def search_entities(
         self,
         query: Optional[str] = None,
@@ -458,6 +537,8 @@ class FileDatabase(EntityDatabase):
         attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
         limit: int = 100,
         offset: int = 0,
+        has_any_field: Optional[List[str]] = None,
+        identifier_values: Optional[List[str]] = None,
     ) -> List[Entity]:
         """Search entities with text query and optional filtering.
 
@@ -472,6 +553,10 @@ class FileDatabase(EntityDatabase):
             attr_filters: Filter by entity attributes (AND logic)
             limit: Maximum number of entities to return
             offset: Number of entities to skip
+            has_any_field: Only include entities where at least one of these
+                dotted field paths is set to a non-null value (OR logic)
+            identifier_values: Only include entities with at least one
+                external identifier whose value is in this list (OR logic)
 
         Returns:
             List of entities matching the search criteria, ranked by relevance
@@ -487,13 +572,18 @@ class FileDatabase(EntityDatabase):
         # Normalize query for case-insensitive search
         normalized_query = query.lower() if query else None
 
+        # Set lookup keeps the identifier filter cheap for long value lists
+        identifier_value_set = set(identifier_values) if identifier_values else None
+
         # Collect entities with relevance scores
         entities_with_scores = []
 
         # Recursively find all JSON files
         for file_path in search_path.rglob("*.json"):
             try:
-                entity = self._load_and_filter_entity(file_path, attr_filters)
+                entity = self._load_and_filter_entity(
+                    file_path, attr_filters, has_any_field, identifier_value_set
+                )
                 if not entity:
                     continue
 
@@ -631,29 +721,8 @@ class FileDatabase(EntityDatabase):
         if "type" not in data:
             raise ValueError("Entity must have a 'type' field")
 
-        entity_type = EntityType(data["type"])
-        entity_subtype = (
-            EntitySubType(data["sub_type"]) if data.get("sub_type") else None
-        )
-
-        # Determine the correct entity class based on type and subtype
-        if entity_type == EntityType.PERSON:
-            return Person.model_validate(data)
-        elif entity_type == EntityType.ORGANIZATION:
-            if entity_subtype == EntitySubType.POLITICAL_PARTY:
-                return PoliticalParty.model_validate(data)
-            elif entity_subtype == EntitySubType.GOVERNMENT_BODY:
-                return GovernmentBody.model_validate(data)
-            elif entity_subtype == EntitySubType.HOSPITAL:
-                return Hospital.model_validate(data)
-            else:
-                return Organization.model_validate(data)
-        elif entity_type == EntityType.LOCATION:
-            return Location.model_validate(data)
-        elif entity_type == EntityType.PROJECT:
-            return Project.model_validate(data)
-        else:
-            raise ValueError(f"Unknown entity type: {entity_type}")
+        entity_class = get_entity_class(data["type"], data.get("sub_type"))
+        return entity_class.model_validate(data)
 
     # ========================================================================
     # Relationship CRUD Operations
@@ -744,8 +813,7 @@ class FileDatabase(EntityDatabase):
             return None
 
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
+            data = self._read_json_file(file_path)
 
             return Relationship.model_validate(data)
 
@@ -823,6 +891,19 @@ class FileDatabase(EntityDatabase):
         # Apply pagination
         return relationships[offset : offset + limit]
 
+    async def count_relationships(self) -> int:
+        """Count all relationships by counting their files on disk.
+
+        Returns:
+            Total number of relationships
+        """
+        search_path = self.base_path / "relationship"
+
+        if not search_path.exists():
+            return 0
+
+        return sum(1 for _ in search_path.rglob("*.json"))
+
     def _load_relationship_from_file(self, file_path: Path) -> Optional[Relationship]:
         """Load a relationship from a file.
 
@@ -836,8 +917,7 @@ class FileDatabase(EntityDatabase):
             json.JSONDecodeError: If JSON is malformed
             ValueError: If relationship data is invalid
         """
-        with open(file_path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         # Check if this is a relationship (has source_entity_id)
         if "source_entity_id" not in data:
@@ -885,8 +965,7 @@ class FileDatabase(EntityDatabase):
         # Recursively find all JSON files
         for file_path in search_path.rglob("*.json"):
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a relationship (has source_entity_id)
                 if "source_entity_id" not in data:
@@ -979,8 +1058,7 @@ class FileDatabase(EntityDatabase):
         # Recursively find all JSON files
         for file_path in search_path.rglob("*.json"):
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a relationship (has source_entity_id)
                 if "source_entity_id" not in data:
@@ -1028,8 +1106,7 @@ class FileDatabase(EntityDatabase):
         if not file_path.exists():
             return None
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         return Version.model_validate(data)
 
@@ -1062,8 +1139,7 @@ class FileDatabase(EntityDatabase):
                 break
 
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a version (has version_number)
                 if "version_number" not in data:
@@ -1127,9 +1203,21 @@ class FileDatabase(EntityDatabase):
 
         # Find all JSON files in the entity/relationship version directory
         for file_path in search_path.glob("*.json"):
+            # Files are named {version-number}.json, so the version range
+            # can be checked before reading the file
+            if min_version is not None or max_version is not None:
+                try:
+                    file_version = int(file_path.stem)
+                except ValueError:
+                    file_version = None
+                if file_version is not None and (
+                    (min_version is not None and file_version < min_version)
+                    or (max_version is not None and file_version > max_version)
+                ):
+                    continue
+
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is a version (has version_number)
                 if "version_number" not in data:
@@ -1197,8 +1285,7 @@ class FileDatabase(EntityDatabase):
         if not file_path.exists():
             return None
 
-        with open(file_path, "r") as f:
-            data = json.load(f)
+        data = self._read_json_file(file_path)
 
         return Author.model_validate(data)
 
@@ -1231,8 +1318,7 @@ class FileDatabase(EntityDatabase):
                 break
 
             try:
-                with open(file_path, "r") as f:
-                    data = json.load(f)
+                data = self._read_json_file(file_path)
 
                 # Check if this is an author (has slug)
                 if "slug" not in data:
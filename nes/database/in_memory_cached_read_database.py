@@ -5,6 +5,7 @@ in-memory cache of entities and relationships. The cache is automatically
 warmed at instantiation and does not support write operations.
 """
 
+from datetime import datetime
 from typing import Dict, List, Optional, Tuple, Union
 
 from beaker.cache import CacheManager
@@ -175,6 +176,32 @@ class InMemoryCachedReadDatabase(EntityDatabase):
         # Convert back to list
         return list(result_tuple)
 
+    async def count_entities(
+        self,
+        entity_type: Optional[str] = None,
+        sub_type: Optional[str] = None,
+        attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
+    ) -> int:
+        """Count entities in cache matching the given filters."""
+        await self._ensure_cache_warmed()
+
+        if not (entity_type or sub_type or attr_filters):
+            return len(self._entity_cache)
+
+        attr_filters_tuple = None
+        if attr_filters:
+            attr_filters_tuple = tuple(sorted(attr_filters.items()))
+
+        return len(
+            self._list_entities_impl(
+                len(self._entity_cache),
+                0,
+                entity_type,
+                sub_type,
+                attr_filters_tuple,
+            )
+        )
+
     def _search_entities_impl(
         self,
         query: Optional[str],
@@ -185,6 +212,8 @@ class InMemoryCachedReadDatabase(EntityDatabase):
         ],
         limit: int,
         offset: int,
+        has_any_field: Optional[Tuple[str, ...]] = None,
+        identifier_values: Optional[Tuple[str, ...]] = None,
     ) -> Tuple[Entity, ...]:
         """Internal implementation of search_entities with hashable parameters.
 
@@ -246,9 +275,40 @@ class InMemoryCachedReadDatabase(EntityDatabase):
                     if e.attributes and e.attributes.get(key) == value
                 ]
 
+        # Apply field presence filter (OR logic)
+        if has_any_field:
+            entities = [
+                e
+                for e in entities
+                if any(self._get_field(e, path) is not None for path in has_any_field)
+            ]
+
+        # Apply identifier value filter (OR logic)
+        if identifier_values:
+            values = set(identifier_values)
+            entities = [
+                e
+                for e in entities
+                if e.identifiers
+                and any(identifier.value in values for identifier in e.identifiers)
+            ]
+
         # Apply pagination and return as tuple
         return tuple(entities[offset : offset + limit])
 
+    @staticmethod
+    def _get_field(entity: Entity, field_path: str):
+        """Resolve a dotted field path on an entity, returning None if unset."""
+        value = entity
+        for key in field_path.split("."):
+            if isinstance(value, dict):
+                value = value.get(key)
+            else:
+                value = getattr(value, key, None)
+            if value is None:
+                return None
+        return value
+
     async def search_entities(
         self,
         query: Optional[str] = None,
@@ -257,6 +317,8 @@ class InMemoryCachedReadDatabase(EntityDatabase):
         attr_filters: Optional[Dict[str, Union[str, int, float, bool]]] = None,
         limit: int = 100,
         offset: int = 0,
+        has_any_field: Optional[List[str]] = None,
+        identifier_values: Optional[List[str]] = None,
     ) -> List[Entity]:
         """Search entities from cache (Beaker cached)."""
         await self._ensure_cache_warmed()
@@ -266,13 +328,25 @@ class InMemoryCachedReadDatabase(EntityDatabase):
         if attr_filters:
             attr_filters_tuple = tuple(sorted(attr_filters.items()))
 
+        has_any_field_tuple = tuple(has_any_field) if has_any_field else None
+        identifier_values_tuple = (
+            tuple(sorted(identifier_values)) if identifier_values else None
+        )
+
         # Create cache key
-        cache_key = f"search_entities:{query}:{entity_type}:{sub_type}:{attr_filters_tuple}:{limit}:{offset}"
+        cache_key = f"search_entities:{query}:{entity_type}:{sub_type}:{attr_filters_tuple}:{limit}:{offset}:{has_any_field_tuple}:{identifier_values_tuple}"
 
         # Try to get from cache
         def create_value():
             return self._search_entities_impl(
-                query, entity_type, sub_type, attr_filters_tuple, limit, offset
+                query,
+                entity_type,
+                sub_type,
+                attr_filters_tuple,
+                limit,
+                offset,
+                has_any_field_tuple,
+                identifier_values_tuple,
             )
 
         result_tuple = self._query_cache.get(key=cache_key, createfunc=create_value)
@@ -303,6 +377,11 @@ class InMemoryCachedReadDatabase(EntityDatabase):
         relationships = list(self._relationship_cache.values())
         return relationships[offset : offset + limit]
 
+    async def count_relationships(self) -> int:
+        """Count relationships in cache."""
+        await self._ensure_cache_warmed()
+        return len(self._relationship_cache)
+
     async def put_version(self, version: Version) -> Version:
         """Not supported - read-only database."""
         raise ValueError("Read-only database does not support write operations")
@@ -323,6 +402,31 @@ class InMemoryCachedReadDatabase(EntityDatabase):
         """Delegate to underlying database - versions not cached."""
         return await self.underlying_db.list_versions(limit=limit, offset=offset)
 
+    async def list_versions_by_entity(
+        self,
+        entity_or_relationship_id: str,
+        limit: int = 100,
+        offset: int = 0,
+        author_slug: Optional[str] = None,
+        created_after: Optional[datetime] = None,
+        created_before: Optional[datetime] = None,
+        min_version: Optional[int] = None,
+        max_version: Optional[int] = None,
+        order: str = "asc",
+    ) -> List[Version]:
+        """Delegate to underlying database - versions not cached."""
+        return await self.underlying_db.list_versions_by_entity(
+            entity_or_relationship_id,
+            limit=limit,
+            offset=offset,
+            author_slug=author_slug,
+            created_after=created_after,
+            created_before=created_before,
+            min_version=min_version,
+            max_version=max_version,
+            order=order,
+        )
+
     async def put_author(self, author: Author) -> Author:
         """Not supported - read-only database."""
         raise ValueError("Read-only database does not support write operations")
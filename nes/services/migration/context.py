@@ -9,7 +9,7 @@ import csv
 import json
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
 from nes.database.entity_database import EntityDatabase
 from nes.services.publication.service import PublicationService
@@ -168,12 +168,54 @@ class MigrationContext:
             logger.error(error_msg)
             raise
 
+    def iter_csv(self, filename: str, **kwargs) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over a CSV file from migration folder row by row.
+
+        Streaming counterpart of read_csv: rows are yielded one at a time
+        instead of being materialized as a list, so large source files can
+        be processed without holding every row in memory.
+
+        Args:
+            filename: Name of the CSV file (relative to migration folder)
+
+        Returns:
+            Iterator of dictionaries, one per row
+
+        Raises:
+            FileNotFoundError: If the CSV file doesn't exist
+            csv.Error: If the CSV file is malformed
+
+        Example:
+            >>> lookup = {row["id"]: row for row in context.iter_csv("entities.csv")}
+        """
+        file_path = self._migration_dir / filename
+
+        if not file_path.exists():
+            error_msg = f"CSV file not found: {filename}"
+            logger.error(error_msg)
+            raise FileNotFoundError(error_msg)
+
+        logger.debug(f"Streaming CSV file: {file_path}")
+
+        def rows() -> Iterator[Dict[str, Any]]:
+            try:
+                with open(file_path, "r", encoding="utf-8", newline="") as f:
+                    yield from csv.DictReader(f, **kwargs)
+
+            except csv.Error as e:
+                error_msg = f"Error reading CSV file {filename}: {e}"
+                logger.error(error_msg)
+                raise
+
+        return rows()
+
     def read_json(self, filename: str) -> Any:
         """
         Read JSON file from migration folder.
 
         Reads a JSON file and returns the parsed data structure
-        (dict, list, or primitive value).
+        (dict, list, or primitive value). A leading UTF-8 BOM is ignored.
 
         Args:
             filename: Name of the JSON file (relative to migration folder)
@@ -10,6 +10,7 @@ This module provides the MigrationRunner class which handles:
 - Storing migration logs for tracking applied migrations
 """
 
+import asyncio
 import importlib.util
 import inspect
 import logging
@@ -19,7 +20,7 @@ import sys
 import time
 import traceback
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, Dict, List, Optional, Tuple
 
 from nes.database.entity_database import EntityDatabase
 from nes.services.migration.context import MigrationContext
@@ -32,6 +33,24 @@ from nes.services.search.service import SearchService
 logger = logging.getLogger(__name__)
 
 
+def _count_json_files(directory: Path) -> int:
+    """Count .json files under a directory tree.
+
+    Uses os.scandir directly, which avoids allocating a Path object per
+    file and is several times faster than rglob on large version trees.
+    """
+    count = 0
+    pending = [directory]
+    while pending:
+        with os.scandir(pending.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    pending.append(entry.path)
+                elif entry.name.endswith(".json"):
+                    count += 1
+    return count
+
+
 class MigrationRunner:
     """
     Executes migration scripts and manages migration logs.
@@ -70,10 +89,19 @@ class MigrationRunner:
         self.db = db
         self.manager = migration_manager
 
+        self._log_base = self.manager.db_path / "migration-logs"
+        self._git_diff_check_disabled = (
+            os.getenv("NES_MIGRATIONS_GIT_DIFF_CHECK_DISABLED", "false").lower()
+            == "true"
+        )
+
+        # Loaded scripts keyed by (script path, mtime_ns, size)
+        self._script_cache: Dict[Tuple[str, int, int], Tuple[Any, dict]] = {}
+
         # Check if database directory is a git repository
         db_repo_path = self.manager.db_path.parent
-        git_dir = db_repo_path / ".git"
-        if not git_dir.exists():
+        self._is_git_repo = (db_repo_path / ".git").exists()
+        if not self._is_git_repo:
             logger.warning(
                 f"Database directory is not a git repository: {db_repo_path}. "
                 "Migration change tracking will not include git diffs. "
@@ -128,6 +156,9 @@ class MigrationRunner:
         - Validates that the script has required metadata (AUTHOR, DATE, DESCRIPTION)
         - Handles syntax errors gracefully
 
+        Loaded scripts are cached per runner and only re-executed when the
+        script file's modification time or size changes.
+
         Args:
             migration: Migration to load script for
 
@@ -148,9 +179,17 @@ class MigrationRunner:
 
         script_path = migration.script_path
 
-        if not script_path.exists():
+        try:
+            stat = script_path.stat()
+        except FileNotFoundError:
             raise ValueError(f"Migration script not found: {script_path}")
 
+        cache_key = (str(script_path), stat.st_mtime_ns, stat.st_size)
+        cached = self._script_cache.get(cache_key)
+        if cached is not None:
+            logger.debug(f"Using cached script for migration {migration.full_name}")
+            return cached
+
         # Create a unique module name to avoid conflicts
         module_name = f"migration_{migration.full_name.replace('-', '_')}"
 
@@ -238,6 +277,7 @@ class MigrationRunner:
             f"author={metadata['author']}, date={metadata['date']}"
         )
 
+        self._script_cache[cache_key] = (migrate_func, metadata)
         return migrate_func, metadata
 
     async def run_migration(
@@ -268,6 +308,10 @@ class MigrationRunner:
             >>> print(result.status)
             MigrationStatus.COMPLETED
         """
+        # Check if migration already applied (determinism check via migration logs)
+        if self._is_migration_logged(migration):
+            return self._skipped_result(migration)
+
         logger.info(f"Running migration {migration.full_name}")
 
         # Create result object
@@ -277,14 +321,8 @@ class MigrationRunner:
         )
 
         # Check for uncommitted changes before running migration (unless disabled)
-        git_diff_check_disabled = (
-            os.getenv("NES_MIGRATIONS_GIT_DIFF_CHECK_DISABLED", "false").lower()
-            == "true"
-        )
-
-        if not git_diff_check_disabled:
-            existing_diff = self._get_git_diff()
-            if existing_diff:
+        if not self._git_diff_check_disabled:
+            if self._has_uncommitted_changes():
                 error_msg = (
                     f"Cannot run migration {migration.full_name}: "
                     "Database has uncommitted changes. "
@@ -301,19 +339,6 @@ class MigrationRunner:
                 "(NES_MIGRATIONS_GIT_DIFF_CHECK_DISABLED=true)"
             )
 
-        # Check if migration already applied (determinism check via migration logs)
-        is_applied = await self._is_migration_logged(migration)
-        if is_applied:
-            logger.info(
-                f"Migration {migration.full_name} already applied "
-                "(migration log exists), skipping"
-            )
-            result.status = MigrationStatus.SKIPPED
-            result.logs.append(
-                f"Migration {migration.full_name} already applied, skipping"
-            )
-            return result
-
         # Load migration script
         try:
             migrate_func, metadata = self._load_script(migration)
@@ -329,12 +354,12 @@ class MigrationRunner:
         context = self.create_context(migration)
 
         # Track statistics before execution
-        entities_before = await self._count_entities()
-        relationships_before = await self._count_relationships()
-        versions_before = self._count_version_files()
+        entities_before, relationships_before, versions_before = (
+            await self._count_stats()
+        )
 
         # Execute migration
-        start_time = time.time()
+        start_time = time.perf_counter()
 
         try:
             logger.info(f"Executing migration {migration.full_name}...")
@@ -343,13 +368,13 @@ class MigrationRunner:
             await migrate_func(context)
 
             # Calculate execution time
-            end_time = time.time()
+            end_time = time.perf_counter()
             result.duration_seconds = end_time - start_time
 
             # Track statistics after execution
-            entities_after = await self._count_entities()
-            relationships_after = await self._count_relationships()
-            versions_after = self._count_version_files()
+            entities_after, relationships_after, versions_after = (
+                await self._count_stats()
+            )
 
             result.entities_created = entities_after - entities_before
             result.relationships_created = relationships_after - relationships_before
@@ -384,7 +409,7 @@ class MigrationRunner:
 
         except Exception as e:
             # Calculate execution time even on failure
-            end_time = time.time()
+            end_time = time.perf_counter()
             result.duration_seconds = end_time - start_time
 
             # Capture error details
@@ -406,6 +431,44 @@ class MigrationRunner:
 
         return result
 
+    def _skipped_result(self, migration: Migration) -> MigrationResult:
+        """
+        Build the result for a migration that has already been applied.
+
+        Args:
+            migration: Migration that has a migration log
+
+        Returns:
+            MigrationResult with SKIPPED status
+        """
+        logger.info(
+            f"Migration {migration.full_name} already applied "
+            "(migration log exists), skipping"
+        )
+        return MigrationResult(
+            migration=migration,
+            status=MigrationStatus.SKIPPED,
+            logs=[f"Migration {migration.full_name} already applied, skipping"],
+        )
+
+    async def _count_stats(self) -> Tuple[int, int, int]:
+        """
+        Count entities, relationships and version files concurrently.
+
+        The version file count walks the filesystem, so it runs in a worker
+        thread while the database counts are awaited.
+
+        Returns:
+            Tuple of (entity count, relationship count, version file count)
+        """
+        return tuple(
+            await asyncio.gather(
+                self._count_entities(),
+                self._count_relationships(),
+                asyncio.to_thread(self._count_version_files),
+            )
+        )
+
     async def _count_entities(self) -> int:
         """
         Count total number of entities in the database.
@@ -414,10 +477,7 @@ class MigrationRunner:
             Total entity count
         """
         try:
-            # Use database's list method with a high limit to get count
-            # This is a simple implementation - could be optimized with a dedicated count method
-            entities = await self.db.list_entities(limit=1000000)
-            return len(entities)
+            return await self.db.count_entities()
         except Exception as e:
             logger.warning(f"Failed to count entities: {e}")
             return 0
@@ -430,10 +490,7 @@ class MigrationRunner:
             Total relationship count
         """
         try:
-            # Use database's list method with a high limit to get count
-            # This is a simple implementation - could be optimized with a dedicated count method
-            relationships = await self.db.list_relationships(limit=1000000)
-            return len(relationships)
+            return await self.db.count_relationships()
         except Exception as e:
             logger.warning(f"Failed to count relationships: {e}")
             return 0
@@ -454,8 +511,7 @@ class MigrationRunner:
                 return 0
 
             # Count all .json files recursively in version directory (including nested folders)
-            version_files = list(version_dir.rglob("*.json"))
-            return len(version_files)
+            return _count_json_files(version_dir)
         except Exception as e:
             logger.warning(f"Failed to count version files: {e}")
             return 0
@@ -470,8 +526,7 @@ class MigrationRunner:
         Returns:
             Path to migration log directory
         """
-        log_base = self.manager.db_path / "migration-logs"
-        return log_base / migration.full_name
+        return self._log_base / migration.full_name
 
     def _check_clean_state(self) -> bool:
         """
@@ -480,8 +535,44 @@ class MigrationRunner:
         Returns:
             True if clean (no uncommitted changes), False otherwise
         """
-        diff = self._get_git_diff()
-        return diff is None or len(diff) == 0
+        return not self._has_uncommitted_changes()
+
+    def _has_uncommitted_changes(self) -> bool:
+        """
+        Check whether the database directory has uncommitted changes.
+
+        Uses a single `git status --porcelain` call instead of building the
+        full diff, so no file contents are read.
+
+        Returns:
+            True if there are modified or untracked files, False if the
+            state is clean, the directory is not a git repository, or git
+            fails
+        """
+        if not self._is_git_repo:
+            return False
+
+        db_repo_path = self.manager.db_path.parent  # nes-db directory
+
+        try:
+            result = subprocess.run(
+                ["git", "status", "--porcelain", "-z"],
+                cwd=db_repo_path,
+                capture_output=True,
+                timeout=30,
+            )
+        except subprocess.TimeoutExpired:
+            logger.error("Git status timed out after 30 seconds")
+            return False
+        except Exception as e:
+            logger.error(f"Failed to get git status: {e}")
+            return False
+
+        if result.returncode != 0:
+            logger.error(f"Git status failed: {result.stderr.decode(errors='replace')}")
+            return False
+
+        return bool(result.stdout)
 
     def _get_git_diff(self) -> Optional[str]:
         """
@@ -498,16 +589,11 @@ class MigrationRunner:
         db_path = self.manager.db_path
         db_repo_path = db_path.parent  # nes-db directory
 
-        try:
-            # Check if it's a git repository (nes-db should be a submodule)
-            git_dir = db_repo_path / ".git"
-            if not git_dir.exists():
-                logger.warning(
-                    f"Database directory is not a git repository: {db_repo_path}. "
-                    "Expected nes-db to be a git submodule."
-                )
-                return None
+        # nes-db should be a submodule; the constructor warns when it is not
+        if not self._is_git_repo:
+            return None
 
+        try:
             diff_parts = []
 
             # Get diff of tracked files (staged and unstaged changes)
@@ -542,30 +628,9 @@ class MigrationRunner:
 
                 # Generate diff for each untracked file
                 for file_path in untracked_files:
-                    file_full_path = db_repo_path / file_path
-                    if file_full_path.exists() and file_full_path.is_file():
-                        try:
-                            # Create a diff showing the file as new
-                            with open(file_full_path, "r", encoding="utf-8") as f:
-                                content = f.read()
-
-                            # Format as a git diff for a new file
-                            file_diff = f"diff --git a/{file_path} b/{file_path}\n"
-                            file_diff += "new file mode 100644\n"
-                            file_diff += "index 0000000..0000000\n"
-                            file_diff += "--- /dev/null\n"
-                            file_diff += f"+++ b/{file_path}\n"
-                            file_diff += (
-                                "@@ -0,0 +1," + str(len(content.splitlines())) + " @@\n"
-                            )
-                            for line in content.splitlines():
-                                file_diff += f"+{line}\n"
-
-                            diff_parts.append(file_diff)
-                        except Exception as e:
-                            logger.warning(
-                                f"Failed to read untracked file {file_path}: {e}"
-                            )
+                    file_diff = self._new_file_diff(db_repo_path, file_path)
+                    if file_diff is not None:
+                        diff_parts.append(file_diff)
 
             # Combine all diffs
             if not diff_parts:
@@ -585,7 +650,40 @@ class MigrationRunner:
             logger.error(f"Failed to get git diff: {e}")
             return None
 
-    async def _is_migration_logged(self, migration: Migration) -> bool:
+    def _new_file_diff(self, db_repo_path: Path, file_path: str) -> Optional[str]:
+        """
+        Format an untracked file as a git diff adding a new file.
+
+        Args:
+            db_repo_path: Root of the database git repository
+            file_path: Path of the untracked file, relative to db_repo_path
+
+        Returns:
+            Diff text for the file, or None if it is not a readable file
+        """
+        file_full_path = db_repo_path / file_path
+        if not file_full_path.is_file():
+            return None
+
+        try:
+            with open(file_full_path, "r", encoding="utf-8") as f:
+                lines = f.read().splitlines()
+        except Exception as e:
+            logger.warning(f"Failed to read untracked file {file_path}: {e}")
+            return None
+
+        header = (
+            f"diff --git a/{file_path} b/{file_path}\n"
+            "new file mode 100644\n"
+            "index 0000000..0000000\n"
+            "--- /dev/null\n"
+            f"+++ b/{file_path}\n"
+            f"@@ -0,0 +1,{len(lines)} @@\n"
+        )
+        # Join once; appending line by line is quadratic for large files
+        return header + "".join(f"+{line}\n" for line in lines)
+
+    def _is_migration_logged(self, migration: Migration) -> bool:
         """
         Check if a migration has been logged (i.e., already applied).
 
@@ -708,6 +806,10 @@ class MigrationRunner:
         """
         logger.info(f"Running batch of {len(migrations)} migrations")
 
+        # Read the migration logs once up front instead of per migration
+        self.manager.clear_cache()
+        applied = set(await self.manager.get_applied_migrations())
+
         results = []
 
         for i, migration in enumerate(migrations, 1):
@@ -715,8 +817,11 @@ class MigrationRunner:
                 f"Processing migration {i}/{len(migrations)}: {migration.full_name}"
             )
 
-            # Execute migration
-            result = await self.run_migration(migration=migration)
+            if migration.full_name in applied:
+                result = self._skipped_result(migration)
+            else:
+                # Execute migration
+                result = await self.run_migration(migration=migration)
 
             results.append(result)
 
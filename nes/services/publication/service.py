@@ -9,21 +9,14 @@ The Publication Service is the central orchestration layer that manages:
 - Business rule enforcement
 """
 
+import asyncio
 import logging
 from datetime import UTC, date, datetime
 from typing import Any, Dict, List, Optional
 
 from nes.core.models.base import Name, NameKind
 from nes.core.models.entity import Entity, EntitySubType, EntityType
-from nes.core.models.location import Location
-from nes.core.models.organization import (
-    GovernmentBody,
-    Hospital,
-    Organization,
-    PoliticalParty,
-)
-from nes.core.models.person import Person
-from nes.core.models.project import Project
+from nes.core.models.entity_type_map import get_entity_class
 from nes.core.models.relationship import Relationship, RelationshipType
 from nes.core.models.version import Author, Version, VersionSummary, VersionType
 from nes.database.entity_database import EntityDatabase
@@ -63,7 +56,8 @@ class PublicationService:
 
         Args:
             entity_type: Type of the entity (optional if 'type' is in entity_data)
-            entity_data: Dictionary containing entity data
+            entity_data: Dictionary containing entity data; nested values
+                (names, address, ...) may be plain dicts or model instances
             author_id: ID of the author creating the entity
             change_description: Description of this change
             entity_subtype: Optional subtype of the entity
@@ -99,7 +93,8 @@ class PublicationService:
 
         # Validate that at least one name has kind='PRIMARY'
         has_primary = any(
-            name.get("kind") == "PRIMARY" or name.get("kind") == NameKind.PRIMARY
+            (name.kind if isinstance(name, Name) else name.get("kind"))
+            == NameKind.PRIMARY
             for name in entity_data["names"]
         )
         if not has_primary:
@@ -576,21 +571,29 @@ class PublicationService:
         entities_data: List[Dict[str, Any]],
         author_id: str,
         change_description: str,
+        max_concurrency: int = 32,
     ) -> List[Entity]:
         """Create multiple entities in batch.
 
+        Creations are submitted concurrently, bounded by max_concurrency.
+
         Args:
             entities_data: List of entity data dictionaries (must include 'type' and optionally 'sub_type')
             author_id: ID of the author creating the entities
             change_description: Description of this batch operation
+            max_concurrency: Maximum number of creations in flight (default: 32)
 
         Returns:
-            List of created entities
+            List of created entities in the same order as entities_data
 
         Raises:
-            ValueError: If any entity creation fails
+            ValueError: If any entity creation fails or the batch contains
+                the same entity twice
         """
-        entities = []
+        from nes.core.identifiers import build_entity_id
+
+        typed_entities_data = []
+        seen_ids = set()
         for entity_data in entities_data:
             entity_type = EntityType(entity_data.get("type"))
             entity_subtype = (
@@ -598,16 +601,94 @@ class PublicationService:
                 if entity_data.get("sub_type")
                 else None
             )
-            entity = await self.create_entity(
-                entity_type=entity_type,
-                entity_data=entity_data,
-                author_id=author_id,
-                change_description=change_description,
-                entity_subtype=entity_subtype,
+
+            # Concurrent creations can't see each other, so reject duplicates
+            # within the batch up front instead of letting one overwrite another
+            entity_id = build_entity_id(
+                entity_type.value,
+                entity_subtype.value if entity_subtype else None,
+                entity_data.get("slug"),
             )
-            entities.append(entity)
+            if entity_id in seen_ids:
+                raise ValueError(f"Duplicate entity {entity_id} in batch")
+            seen_ids.add(entity_id)
+
+            typed_entities_data.append((entity_type, entity_subtype, entity_data))
+
+        if not typed_entities_data:
+            return []
 
-        return entities
+        # Resolve the author once so concurrent creations don't race to create it
+        await self._get_or_create_author(author_id)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def create(
+            entity_type: EntityType,
+            entity_subtype: Optional[EntitySubType],
+            entity_data: Dict[str, Any],
+        ) -> Entity:
+            async with semaphore:
+                return await self.create_entity(
+                    entity_type=entity_type,
+                    entity_data=entity_data,
+                    author_id=author_id,
+                    change_description=change_description,
+                    entity_subtype=entity_subtype,
+                )
+
+        return list(await asyncio.gather(*(create(*t) for t in typed_entities_data)))
+
+    async def batch_update_entities(
+        self,
+        entities: List[Entity],
+        author_id: str,
+        change_description: str,
+        max_concurrency: int = 32,
+    ) -> List[Entity]:
+        """Update multiple entities in batch.
+
+        Updates are submitted concurrently, bounded by max_concurrency, so
+        large migrations are not limited by one storage round trip at a time.
+
+        Args:
+            entities: Entities to update (with modifications)
+            author_id: ID of the author updating the entities
+            change_description: Description of this batch operation
+            max_concurrency: Maximum number of updates in flight (default: 32)
+
+        Returns:
+            List of updated entities in the same order as entities
+
+        Raises:
+            ValueError: If any entity doesn't exist, an update is invalid, or
+                the batch contains the same entity twice
+        """
+        # Concurrent updates of one entity would race on its version number,
+        # so reject duplicates within the batch up front
+        seen_ids = set()
+        for entity in entities:
+            if entity.id in seen_ids:
+                raise ValueError(f"Duplicate entity {entity.id} in batch")
+            seen_ids.add(entity.id)
+
+        if not entities:
+            return []
+
+        # Resolve the author once so concurrent updates don't race to create it
+        await self._get_or_create_author(author_id)
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+
+        async def update(entity: Entity) -> Entity:
+            async with semaphore:
+                return await self.update_entity(
+                    entity=entity,
+                    author_id=author_id,
+                    change_description=change_description,
+                )
+
+        return list(await asyncio.gather(*(update(entity) for entity in entities)))
 
     # Helper methods
 
@@ -650,31 +731,7 @@ class PublicationService:
         Raises:
             ValueError: If entity type is invalid
         """
-        entity_type = entity_data.get("type")
-        entity_subtype = entity_data.get("sub_type")
-
-        if entity_type == "person" or entity_type == EntityType.PERSON:
-            return Person.model_validate(entity_data)
-        elif entity_type == "organization" or entity_type == EntityType.ORGANIZATION:
-            if (
-                entity_subtype == "political_party"
-                or entity_subtype == EntitySubType.POLITICAL_PARTY
-            ):
-                return PoliticalParty.model_validate(entity_data)
-            elif (
-                entity_subtype == "government_body"
-                or entity_subtype == EntitySubType.GOVERNMENT_BODY
-            ):
-                return GovernmentBody.model_validate(entity_data)
-            elif (
-                entity_subtype == "hospital" or entity_subtype == EntitySubType.HOSPITAL
-            ):
-                return Hospital.model_validate(entity_data)
-            else:
-                return Organization.model_validate(entity_data)
-        elif entity_type == "location" or entity_type == EntityType.LOCATION:
-            return Location.model_validate(entity_data)
-        elif entity_type == "project" or entity_type == EntityType.PROJECT:
-            return Project.model_validate(entity_data)
-        else:
-            raise ValueError(f"Unknown entity type: {entity_type}")
+        entity_class = get_entity_class(
+            entity_data.get("type"), entity_data.get("sub_type")
+        )
+        return entity_class.model_validate(entity_data)
@@ -22,10 +22,13 @@ Configuration:
 """
 
 import asyncio
+import copy
+import functools
 import json
 import logging
 import time
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, Optional
 
 from .base import BaseLLMProvider
@@ -71,6 +74,7 @@ class GoogleVertexAIProvider(BaseLLMProvider):
         temperature: float = 0.7,
         credentials_path: Optional[str] = None,
         enable_cache: bool = True,
+        max_concurrency: int = 32,
     ):
         """Initialize the Google Vertex AI provider.
 
@@ -82,6 +86,7 @@ class GoogleVertexAIProvider(BaseLLMProvider):
             temperature: Sampling temperature 0.0-1.0 (default: 0.7)
             credentials_path: Path to service account key file (optional)
             enable_cache: Enable response caching (default: True)
+            max_concurrency: Maximum number of in-flight API calls (default: 32)
 
         Raises:
             ValueError: If model_id is not supported
@@ -129,21 +134,76 @@ class GoogleVertexAIProvider(BaseLLMProvider):
         self.total_output_tokens = 0
 
         # Rate limiting
-        self._last_request_time = 0
+        self._next_request_time = 0.0
         self._min_request_interval = 0.1  # 100ms between requests
 
+        # Models keyed by system instruction. Each GenerativeModel owns its
+        # prediction client, so reusing them keeps the underlying channel
+        # (and its TLS session) alive across calls.
+        self._models: Dict[str, Any] = {"": self.client}
+
+        # The SDK is synchronous: calls run on a dedicated thread pool sized
+        # to the concurrency limit rather than the small default executor.
+        # The pool is created on first use, so providers that never make a
+        # call own no threads.
+        self._max_concurrency = max_concurrency
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._executor: Optional[ThreadPoolExecutor] = None
+
         logger.info(
             f"GoogleVertexAIProvider initialized: project={project_id}, "
             f"location={location}, model={model_id}"
         )
 
     async def _rate_limit(self) -> None:
-        """Apply rate limiting between requests."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            await asyncio.sleep(self._min_request_interval - time_since_last)
-        self._last_request_time = time.time()
+        """Apply rate limiting between requests.
+
+        Each caller reserves the next send slot before sleeping, so
+        concurrent requests stay spaced by the minimum interval instead
+        of all waking at once.
+        """
+        current_time = time.monotonic()
+        send_time = max(current_time, self._next_request_time)
+        self._next_request_time = send_time + self._min_request_interval
+        if send_time > current_time:
+            await asyncio.sleep(send_time - current_time)
+
+    def _get_model(self, system_instruction: Optional[str] = None) -> Any:
+        """Return the cached GenerativeModel for a system instruction."""
+        key = system_instruction or ""
+        model = self._models.get(key)
+        if model is None:
+            from vertexai.generative_models import GenerativeModel
+
+            model = GenerativeModel(
+                self.model_id, system_instruction=system_instruction
+            )
+            self._models[key] = model
+        return model
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Return the worker thread pool, creating it on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_concurrency, thread_name_prefix="vertexai"
+            )
+        return self._executor
+
+    async def aclose(self) -> None:
+        """Release cached models and shut down the worker thread pool."""
+        self._models.clear()
+        executor, self._executor = self._executor, None
+        if executor is not None:
+            # Wait for in-flight SDK calls without blocking the event loop
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(executor.shutdown, wait=True)
+            )
+
+    def __del__(self) -> None:
+        # Providers that are never closed must not leak their worker threads
+        executor = getattr(self, "_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False)
 
     async def _retry_with_backoff(self, func, *args, max_retries: int = 10, **kwargs):
         """Retry function with exponential backoff on rate limit errors.
@@ -158,8 +218,12 @@ class GoogleVertexAIProvider(BaseLLMProvider):
         """
         for attempt in range(max_retries):
             try:
-                await self._rate_limit()
-                return await asyncio.to_thread(func, *args, **kwargs)
+                async with self._semaphore:
+                    await self._rate_limit()
+                    return await asyncio.get_running_loop().run_in_executor(
+                        self._get_executor(),
+                        functools.partial(func, *args, **kwargs),
+                    )
             except Exception as e:
                 error_str = str(e)
                 if "429" in error_str or "ResourceExhausted" in error_str:
@@ -194,7 +258,7 @@ class GoogleVertexAIProvider(BaseLLMProvider):
             Generated text response
         """
         try:
-            from vertexai.generative_models import GenerationConfig, GenerativeModel
+            from vertexai.generative_models import GenerationConfig
 
             max_tokens = max_tokens or self.max_tokens
             temperature = temperature if temperature is not None else self.temperature
@@ -204,10 +268,7 @@ class GoogleVertexAIProvider(BaseLLMProvider):
                 temperature=temperature,
             )
 
-            model = GenerativeModel(
-                self.model_id,
-                system_instruction=system_prompt if system_prompt else None,
-            )
+            model = self._get_model(system_prompt)
 
             logger.debug(f"Invoking Vertex AI chat: {self.model_id}")
 
@@ -251,7 +312,7 @@ class GoogleVertexAIProvider(BaseLLMProvider):
             json.JSONDecodeError: If the LLM response cannot be parsed as JSON
             Exception: If data extraction fails for any other reason
         """
-        from vertexai.generative_models import GenerationConfig, GenerativeModel
+        from vertexai.generative_models import GenerationConfig
 
         system_instruction = "You are a data extraction assistant. Extract structured information from text."
 
@@ -259,13 +320,12 @@ class GoogleVertexAIProvider(BaseLLMProvider):
             max_output_tokens=self.max_tokens,
             temperature=0.3,
             response_mime_type="application/json",
-            response_schema=schema,
+            # The SDK rewrites nested schema dicts in place; hand it a copy so
+            # callers can reuse one schema across requests
+            response_schema=copy.deepcopy(schema),
         )
 
-        model = GenerativeModel(
-            self.model_id,
-            system_instruction=system_instruction,
-        )
+        model = self._get_model(system_instruction)
 
         prompt = f"{instructions}\n\nText to analyze:\n{text}"
         response = await self._retry_with_backoff(
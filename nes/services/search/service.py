@@ -63,6 +63,8 @@ class SearchService:
         attributes: Optional[Dict[str, Union[str, int, float, bool]]] = None,
         limit: int = 100,
         offset: int = 0,
+        has_any_field: Optional[List[str]] = None,
+        identifier_values: Optional[List[str]] = None,
     ) -> List[Entity]:
         """Search entities with text query and optional filtering.
 
@@ -77,6 +79,10 @@ class SearchService:
             attributes: Filter by entity attributes (AND logic)
             limit: Maximum number of entities to return (default: 100)
             offset: Number of entities to skip (default: 0)
+            has_any_field: Only include entities where at least one of these
+                dotted field paths is set (OR logic)
+            identifier_values: Only include entities with an external
+                identifier whose value is in this list (OR logic)
 
         Returns:
             List of entities matching the search criteria, ranked by relevance
@@ -96,6 +102,21 @@ class SearchService:
             ...     attributes={"party": "nepali-congress"}
             ... )
 
+            >>> # Only persons with any family detail recorded
+            >>> results = await service.search_entities(
+            ...     entity_type="person",
+            ...     has_any_field=[
+            ...         "personal_details.father_name",
+            ...         "personal_details.mother_name",
+            ...     ],
+            ... )
+
+            >>> # Look up persons by their external identifier values
+            >>> results = await service.search_entities(
+            ...     entity_type="person",
+            ...     identifier_values=["12345", "67890"],
+            ... )
+
             >>> # Paginated search
             >>> page1 = await service.search_entities(query="politician", limit=20, offset=0)
             >>> page2 = await service.search_entities(query="politician", limit=20, offset=20)
@@ -107,6 +128,8 @@ class SearchService:
             attr_filters=attributes,
             limit=limit,
             offset=offset,
+            has_any_field=has_any_field,
+            identifier_values=identifier_values,
         )
 
     async def get_entity(self, entity_id: str) -> Optional[Entity]:
@@ -63,3 +63,17 @@ def test_validate_author_id_valid():
 
     # Invalid slug (too short)
     assert not is_valid_author_id("author:ab")
+
+
+def test_validate_entity_id_unsupported_subtype():
+    """Test that subtypes are checked against the entity type."""
+    from nes.core.identifiers.validators import is_valid_entity_id
+
+    assert is_valid_entity_id("entity:organization/political_party/nepali-congress")
+    assert is_valid_entity_id("entity:location/district/kathmandu")
+
+    # Known subtype, wrong entity type
+    assert not is_valid_entity_id("entity:person/political_party/ram-chandra-poudel")
+    # Unknown subtype / entity type
+    assert not is_valid_entity_id("entity:organization/unknown_type/nepali-congress")
+    assert not is_valid_entity_id("entity:unknown/ram-chandra-poudel")
@@ -12,6 +12,7 @@ from nes.core.models.base import (
     NameKind,
     NameParts,
     ProvenanceMethod,
+    make_lang_text,
 )
 
 
@@ -77,6 +78,24 @@ def test_contact_validation():
         Contact(type=ContactType.PHONE, value="123456")
 
 
+def test_contact_validation_by_type():
+    """Test that each contact type gets the matching value check."""
+
+    # Social profiles are validated as URLs
+    Contact(type=ContactType.FACEBOOK, value="https://facebook.com/example")
+    with pytest.raises(ValidationError):
+        Contact(type=ContactType.TWITTER, value="@example")
+
+    # WhatsApp numbers use the same E.164 check as phones
+    Contact(type=ContactType.WHATSAPP, value="+9779841234567")
+    with pytest.raises(ValidationError):
+        Contact(type=ContactType.WHATSAPP, value="9841234567")
+
+    # Free-form types accept any value
+    contact = Contact(type=ContactType.TELEGRAM, value="@example")
+    assert contact.value == "@example"
+
+
 def test_lang_text_structure():
     """Test LangText model structure."""
 
@@ -96,3 +115,51 @@ def test_lang_text_structure():
     )
     assert text.en.value == "English"
     assert text.ne.value == "नेपाली"
+
+
+def test_value_models_are_frozen():
+    """Test that value models are immutable and hashable."""
+
+    text = LangText(en=LangTextValue(value="English", provenance="human"))
+    with pytest.raises(ValidationError):
+        text.en = LangTextValue(value="Changed", provenance="human")
+    assert hash(text) == hash(
+        LangText(en=LangTextValue(value="English", provenance="human"))
+    )
+
+    name = Name(kind=NameKind.PRIMARY, en=NameParts(full="Ram Chandra Poudel"))
+    with pytest.raises(ValidationError):
+        name.en.full = "Changed"
+
+    # Changes are made on copies
+    renamed = name.model_copy(update={"en": NameParts(full="Changed")})
+    assert renamed.en.full == "Changed"
+    assert name.en.full == "Ram Chandra Poudel"
+
+
+def test_make_lang_text_shares_instances():
+    """Test that make_lang_text returns one shared, immutable LangText."""
+
+    text = make_lang_text("Tree", "रुख", "translation_service", "imported")
+    assert text.en.value == "Tree"
+    assert text.en.provenance == ProvenanceMethod.TRANSLATION_SERVICE
+    assert text.ne.value == "रुख"
+    assert text.ne.provenance == ProvenanceMethod.IMPORTED
+    assert make_lang_text("Tree", "रुख", "translation_service", "imported") is text
+
+    with pytest.raises(ValidationError):
+        text.en = None
+
+    # Missing languages are left unset
+    text = make_lang_text(ne="रुख")
+    assert text.en is None
+    assert text.ne.value == "रुख"
+
+
+def test_name_kinds_are_distinct():
+    """Test that every NameKind has its own value (no enum aliases)."""
+
+    assert len(NameKind.__members__) == len(NameKind)
+    assert NameKind.OFFICIAL is not NameKind.BIRTH
+    assert NameKind("OFFICIAL") is NameKind.OFFICIAL
+    assert Name(kind="OFFICIAL", en=NameParts(full="Test")).kind is NameKind.OFFICIAL
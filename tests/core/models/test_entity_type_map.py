@@ -0,0 +1,50 @@
+"""Tests for entity type/subtype mapping in nes."""
+
+import pytest
+
+from nes.core.models.entity import EntitySubType, EntityType
+from nes.core.models.entity_type_map import ENTITY_TYPE_MAP, get_entity_class
+from nes.core.models.location import Location, LocationType
+from nes.core.models.organization import (
+    GovernmentBody,
+    Hospital,
+    Organization,
+    PoliticalParty,
+)
+from nes.core.models.person import Person
+from nes.core.models.project import Project
+
+
+def test_entity_class_covers_type_map():
+    """Test that every allowed type/subtype pair has a model class."""
+    for entity_type, subtypes in ENTITY_TYPE_MAP.items():
+        for subtype in subtypes:
+            entity_class = get_entity_class(entity_type, subtype)
+            assert entity_class.model_fields["type"].default == entity_type
+
+
+def test_get_entity_class():
+    """Test resolving model classes from enums and raw strings."""
+    assert get_entity_class(EntityType.PERSON) is Person
+    assert get_entity_class("person", None) is Person
+    assert (
+        get_entity_class(EntityType.ORGANIZATION, EntitySubType.POLITICAL_PARTY)
+        is PoliticalParty
+    )
+    assert get_entity_class("organization", "government_body") is GovernmentBody
+    assert get_entity_class("organization", "hospital") is Hospital
+    assert get_entity_class("organization", "ngo") is Organization
+    assert get_entity_class("location", "district") is Location
+    assert get_entity_class("project", "development_project") is Project
+
+
+def test_get_entity_class_unknown_type():
+    """Test that unknown entity types are rejected."""
+    with pytest.raises(ValueError, match="Unknown entity type"):
+        get_entity_class("unknown")
+
+
+def test_location_subtypes_match_location_types():
+    """Test that allowed location subtypes and LocationType stay in sync."""
+    subtypes = ENTITY_TYPE_MAP[EntityType.LOCATION] - {None}
+    assert {subtype.value for subtype in subtypes} == {lt.value for lt in LocationType}
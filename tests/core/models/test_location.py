@@ -291,3 +291,31 @@ def test_location_hierarchy():
     assert municipality.administrative_level == 3
     assert district.parent == province.id
     assert municipality.parent == district.id
+
+
+def test_location_computed_fields_serialized():
+    """Test that location_type and administrative_level are serialized."""
+
+    def make(sub_type):
+        return Location(
+            slug="test-location",
+            sub_type=sub_type,
+            names=[Name(kind=NameKind.PRIMARY, en={"full": "Test Location"})],
+            version_summary=VersionSummary(
+                entity_or_relationship_id="entity:location/test-location",
+                type=VersionType.ENTITY,
+                version_number=1,
+                author=Author(slug="system"),
+                change_description="Initial",
+                created_at=datetime.now(UTC),
+            ),
+            created_at=datetime.now(UTC),
+        )
+
+    data = make(EntitySubType.RURAL_MUNICIPALITY).model_dump()
+    assert data["location_type"] == LocationType.RURAL_MUNICIPALITY
+    assert data["administrative_level"] == 3
+
+    data = make(None).model_dump()
+    assert data["location_type"] is None
+    assert data["administrative_level"] is None
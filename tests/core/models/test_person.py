@@ -278,3 +278,25 @@ def test_candidacy_validates_entity_ids():
                 nec_id=2,
             ),
         )
+
+
+def test_person_details_history_is_immutable():
+    """Test that education and positions are stored as tuples."""
+
+    details = PersonDetails.model_validate(
+        {
+            "education": [{"institution": {"en": {"value": "Tribhuvan University"}}}],
+            "positions": [{"title": {"en": {"value": "Party Leader"}}}],
+        }
+    )
+
+    assert isinstance(details.education, tuple)
+    assert isinstance(details.positions, tuple)
+    assert details.education[0].institution.en.value == "Tribhuvan University"
+
+    # Serialized as JSON arrays
+    data = details.model_dump(mode="json")
+    assert data["education"][0]["institution"]["en"]["value"] == (
+        "Tribhuvan University"
+    )
+    assert isinstance(data["positions"], list)
@@ -39,14 +39,17 @@ class TestEntityDatabaseInterface:
             "get_entity",
             "delete_entity",
             "list_entities",
+            "count_entities",
             "put_relationship",
             "get_relationship",
             "delete_relationship",
             "list_relationships",
+            "count_relationships",
             "put_version",
             "get_version",
             "delete_version",
             "list_versions",
+            "list_versions_by_entity",
             "put_author",
             "get_author",
             "delete_author",
@@ -334,6 +337,55 @@ class TestEntityDatabaseEntityOperations:
         page2_ids = [e.id for e in page2]
         assert len(set(page1_ids) & set(page2_ids)) == 0
 
+    @pytest.mark.asyncio
+    async def test_count_entities(
+        self,
+        temp_db_path,
+        sample_person_entity,
+        sample_organization_entity,
+        sample_location_entity,
+    ):
+        """Test that count_entities counts entities matching the filters."""
+        from nes.database.file_database import FileDatabase
+
+        db = FileDatabase(base_path=str(temp_db_path))
+
+        assert await db.count_entities() == 0
+
+        await db.put_entity(sample_person_entity)
+        await db.put_entity(sample_organization_entity)
+        await db.put_entity(sample_location_entity)
+
+        assert await db.count_entities() == 3
+        assert await db.count_entities(entity_type="person") == 1
+        assert (
+            await db.count_entities(
+                entity_type="organization", sub_type="political_party"
+            )
+            == 1
+        )
+        assert await db.count_entities(entity_type="organization", sub_type="ngo") == 0
+
+    @pytest.mark.asyncio
+    async def test_count_entities_skips_invalid_files(
+        self, temp_db_path, sample_person_entity
+    ):
+        """Test that count_entities skips the files list_entities skips."""
+        from nes.database.file_database import FileDatabase
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        await db.put_entity(sample_person_entity)
+
+        person_dir = temp_db_path / "entity" / "person"
+        (person_dir / "malformed.json").write_text("{not json")
+        (person_dir / "not-utf8.json").write_bytes(b'{"type": "person\xff"}')
+        (person_dir / "invalid.json").write_text('{"type": "person"}')
+
+        entities = await db.list_entities(entity_type="person", limit=100)
+        assert len(entities) == 1
+        assert await db.count_entities(entity_type="person") == 1
+        assert await db.count_entities() == 1
+
 
 class TestEntityDatabaseRelationshipOperations:
     """Test relationship CRUD operations through EntityDatabase interface."""
@@ -463,6 +515,7 @@ class TestEntityDatabaseRelationshipOperations:
 
         # Should return all 3 relationships
         assert len(relationships) == 3
+        assert await db.count_relationships() == 3
 
 
 class TestEntityDatabaseVersionOperations:
@@ -17,7 +17,7 @@ from datetime import UTC, datetime
 import pytest
 
 from nes.core.models.base import Name, NameKind
-from nes.core.models.entity import EntitySubType
+from nes.core.models.entity import EntitySubType, ExternalIdentifier, IdentifierScheme
 from nes.core.models.location import Location
 from nes.core.models.organization import PoliticalParty
 from nes.core.models.person import Person
@@ -651,6 +651,45 @@ class TestAttributeBasedFiltering:
         assert len(results) >= 1
         assert any(e.slug == "nepali-congress" for e in results)
 
+    @pytest.mark.asyncio
+    async def test_search_filter_by_field_presence(self, populated_db):
+        """Test that has_any_field keeps entities with any listed field set."""
+        results = await populated_db.search_entities(
+            has_any_field=["attributes.constituency"]
+        )
+
+        assert {e.slug for e in results} == {
+            "ram-chandra-poudel",
+            "sher-bahadur-deuba",
+            "pushpa-kamal-dahal",
+        }
+
+    @pytest.mark.asyncio
+    async def test_search_filter_by_field_presence_or_logic(self, populated_db):
+        """Test that has_any_field applies OR logic across field paths."""
+        results = await populated_db.search_entities(
+            has_any_field=["attributes.ideology", "personal_details.father_name"]
+        )
+
+        assert [e.slug for e in results] == ["nepali-congress"]
+
+    @pytest.mark.asyncio
+    async def test_search_filter_by_identifier_values(self, populated_db):
+        """Test that identifier_values keeps entities with a matching identifier."""
+        person = await populated_db.get_entity("entity:person/sher-bahadur-deuba")
+        person.identifiers = [
+            ExternalIdentifier(scheme=IdentifierScheme.OTHER, value="339")
+        ]
+        await populated_db.put_entity(person)
+
+        results = await populated_db.search_entities(
+            entity_type="person", identifier_values=["339", "1000"]
+        )
+        assert [e.slug for e in results] == ["sher-bahadur-deuba"]
+
+        results = await populated_db.search_entities(identifier_values=["1000"])
+        assert results == []
+
 
 class TestSearchResultRanking:
     """Test search result ranking and relevance."""
@@ -17,6 +17,7 @@ import pytest
 
 from nes.core.identifiers.builders import build_relationship_id
 from nes.core.models.base import Name, NameKind
+from nes.core.models.entity import ExternalIdentifier, IdentifierScheme
 from nes.core.models.organization import PoliticalParty
 from nes.core.models.person import Person
 from nes.core.models.relationship import Relationship
@@ -301,6 +302,28 @@ class TestReadOperations:
         assert len(results) == 1
         assert results[0].slug == "nepali-congress"
 
+    @pytest.mark.asyncio
+    async def test_count_entities_matches_cache(self, temp_db_path):
+        """count_entities should count cached entities with filters."""
+        underlying_db = FileDatabase(base_path=str(temp_db_path))
+
+        await underlying_db.put_entity(create_person("person-1", "Person 1"))
+        await underlying_db.put_entity(create_person("person-2", "Person 2"))
+        await underlying_db.put_entity(
+            create_political_party("nepali-congress", "Nepali Congress")
+        )
+
+        cached_db = InMemoryCachedReadDatabase(underlying_db)
+
+        assert await cached_db.count_entities() == 3
+        assert await cached_db.count_entities(entity_type="person") == 2
+        assert (
+            await cached_db.count_entities(
+                entity_type="organization", sub_type="political_party"
+            )
+            == 1
+        )
+
     @pytest.mark.asyncio
     async def test_list_relationships_returns_all_cached_relationships(
         self, temp_db_path
@@ -331,6 +354,7 @@ class TestReadOperations:
         # Should return all 3 relationships
         results = await cached_db.list_relationships()
         assert len(results) == 3
+        assert await cached_db.count_relationships() == 3
 
     @pytest.mark.asyncio
     async def test_search_entities_finds_matching_names(self, temp_db_path):
@@ -356,6 +380,50 @@ class TestReadOperations:
         results = await cached_db.search_entities(query="Pushpa")
         assert len(results) == 1
 
+    @pytest.mark.asyncio
+    async def test_search_entities_filters_by_field_presence(self, temp_db_path):
+        """search_entities should honour has_any_field on cached entities."""
+        underlying_db = FileDatabase(base_path=str(temp_db_path))
+
+        person1 = create_person("ram-kumar-sharma", "Ram Kumar Sharma")
+        person1.attributes = {"party": "nepali-congress"}
+        person2 = create_person("shyam-prasad-sharma", "Shyam Prasad Sharma")
+
+        await underlying_db.put_entity(person1)
+        await underlying_db.put_entity(person2)
+
+        cached_db = InMemoryCachedReadDatabase(underlying_db)
+
+        results = await cached_db.search_entities(has_any_field=["attributes.party"])
+        assert [e.slug for e in results] == ["ram-kumar-sharma"]
+
+        results = await cached_db.search_entities(
+            has_any_field=["personal_details.father_name"]
+        )
+        assert results == []
+
+    @pytest.mark.asyncio
+    async def test_search_entities_filters_by_identifier_values(self, temp_db_path):
+        """search_entities should honour identifier_values on cached entities."""
+        underlying_db = FileDatabase(base_path=str(temp_db_path))
+
+        person1 = create_person("ram-kumar-sharma", "Ram Kumar Sharma")
+        person1.identifiers = [
+            ExternalIdentifier(scheme=IdentifierScheme.OTHER, value="339")
+        ]
+        person2 = create_person("shyam-prasad-sharma", "Shyam Prasad Sharma")
+
+        await underlying_db.put_entity(person1)
+        await underlying_db.put_entity(person2)
+
+        cached_db = InMemoryCachedReadDatabase(underlying_db)
+
+        results = await cached_db.search_entities(identifier_values=["339", "1000"])
+        assert [e.slug for e in results] == ["ram-kumar-sharma"]
+
+        results = await cached_db.search_entities(identifier_values=["1000"])
+        assert results == []
+
 
 class TestWriteOperationsRejection:
     """Test that write operations are properly rejected."""
@@ -458,6 +526,10 @@ class TestVersionOperations:
         versions = await cached_db.list_versions()
         assert len(versions) >= 1
 
+        # Test list_versions_by_entity
+        versions = await cached_db.list_versions_by_entity("entity:person/test-person")
+        assert [v.version_number for v in versions] == [1]
+
 
 class TestAuthorOperations:
     """Test that author operations delegate to underlying database."""
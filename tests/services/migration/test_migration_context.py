@@ -189,6 +189,38 @@ def test_read_csv_file_not_found(temp_migration_dir, mock_services):
     assert "CSV file not found: nonexistent.csv" in str(exc_info.value)
 
 
+def test_iter_csv(temp_migration_dir, mock_services):
+    """Test streaming CSV rows."""
+    context = MigrationContext(
+        publication_service=mock_services["publication"],
+        search_service=mock_services["search"],
+        scraping_service=mock_services["scraping"],
+        db=mock_services["db"],
+        migration_dir=temp_migration_dir,
+    )
+
+    rows = context.iter_csv("test.csv")
+
+    assert not isinstance(rows, list)
+    assert list(rows) == context.read_csv("test.csv")
+
+
+def test_iter_csv_file_not_found(temp_migration_dir, mock_services):
+    """Test that iter_csv raises FileNotFoundError before iteration starts."""
+    context = MigrationContext(
+        publication_service=mock_services["publication"],
+        search_service=mock_services["search"],
+        scraping_service=mock_services["scraping"],
+        db=mock_services["db"],
+        migration_dir=temp_migration_dir,
+    )
+
+    with pytest.raises(FileNotFoundError) as exc_info:
+        context.iter_csv("nonexistent.csv")
+
+    assert "CSV file not found: nonexistent.csv" in str(exc_info.value)
+
+
 def test_read_json(temp_migration_dir, mock_services):
     """Test reading JSON files."""
     context = MigrationContext(
@@ -209,6 +241,22 @@ def test_read_json(temp_migration_dir, mock_services):
     assert data["entities"][1]["name"] == "Test 2"
 
 
+def test_read_json_with_bom(temp_migration_dir, mock_services):
+    """Test that read_json ignores a leading UTF-8 BOM."""
+    bom_file = temp_migration_dir / "bom.json"
+    bom_file.write_bytes('\ufeff{"name": "नेपाल"}'.encode("utf-8"))
+
+    context = MigrationContext(
+        publication_service=mock_services["publication"],
+        search_service=mock_services["search"],
+        scraping_service=mock_services["scraping"],
+        db=mock_services["db"],
+        migration_dir=temp_migration_dir,
+    )
+
+    assert context.read_json("bom.json") == {"name": "नेपाल"}
+
+
 def test_read_json_file_not_found(temp_migration_dir, mock_services):
     """Test that read_json raises FileNotFoundError for missing files."""
     context = MigrationContext(
@@ -163,6 +163,37 @@ async def test_load_script_success(services, temp_migrations_dir, temp_db_repo):
     assert metadata["description"] == "Test migration for unit tests"
 
 
+@pytest.mark.asyncio
+async def test_load_script_cached_until_modified(
+    services, temp_migrations_dir, temp_db_repo
+):
+    """Test that scripts are reused until the file changes."""
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+    runner = MigrationRunner(
+        publication_service=services["publication"],
+        search_service=services["search"],
+        scraping_service=services["scraping"],
+        db=services["db"],
+        migration_manager=manager,
+    )
+
+    migrations = await manager.discover_migrations()
+    migration = migrations[0]
+
+    migrate_func, _ = runner._load_script(migration)
+    assert runner._load_script(migration)[0] is migrate_func
+
+    migration.script_path.write_text(
+        migration.script_path.read_text().replace(
+            "Test migration for unit tests", "Updated test migration"
+        )
+    )
+
+    reloaded_func, metadata = runner._load_script(migration)
+    assert reloaded_func is not migrate_func
+    assert metadata["description"] == "Updated test migration"
+
+
 @pytest.mark.asyncio
 async def test_load_script_missing_metadata(
     services, temp_migrations_dir, temp_db_repo
@@ -207,7 +238,8 @@ async def test_run_migration_success(services, temp_migrations_dir, temp_db_repo
         migration_manager=manager,
     )
 
-    # Mock _get_git_diff to always return None (clean state) for tests
+    # Mock the uncommitted changes check to report a clean state for tests
+    runner._has_uncommitted_changes = lambda: False
     runner._get_git_diff = lambda: None
 
     migrations = await manager.discover_migrations()
@@ -267,4 +299,78 @@ async def test_run_migration_skipped(services, temp_migrations_dir, temp_db_repo
     assert "already applied" in result.logs[0]
 
 
+@pytest.mark.asyncio
+async def test_run_migration_skipped_without_git_check(
+    services, temp_migrations_dir, temp_db_repo
+):
+    """Test that already-applied migrations skip the uncommitted changes check."""
+    log_dir = temp_db_repo / "v2" / "migration-logs" / "000-test-migration"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    (log_dir / "metadata.json").write_text("{}")
+
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+    runner = MigrationRunner(
+        publication_service=services["publication"],
+        search_service=services["search"],
+        scraping_service=services["scraping"],
+        db=services["db"],
+        migration_manager=manager,
+    )
+
+    def fail_git_check():
+        raise AssertionError("git should not run for applied migrations")
+
+    runner._has_uncommitted_changes = fail_git_check
+    runner._get_git_diff = fail_git_check
+
+    migrations = await manager.discover_migrations()
+    result = await runner.run_migration(migrations[0])
+
+    assert result.status == MigrationStatus.SKIPPED
+
+
 # Force flag removed - migrations are automatically skipped if already applied
+
+
+@pytest.mark.asyncio
+async def test_run_migrations_skips_applied(
+    services, temp_migrations_dir, temp_db_repo
+):
+    """Test that a batch skips applied migrations and runs pending ones."""
+    migration_001 = temp_migrations_dir / "001-second-migration"
+    migration_001.mkdir()
+    (migration_001 / "migrate.py").write_text(
+        """
+AUTHOR = "test@example.com"
+DATE = "2024-01-21"
+DESCRIPTION = "Second test migration"
+
+async def migrate(context):
+    context.log("Second migration executed")
+"""
+    )
+
+    log_dir = temp_db_repo / "v2" / "migration-logs" / "000-test-migration"
+    log_dir.mkdir(parents=True, exist_ok=True)
+    (log_dir / "metadata.json").write_text("{}")
+
+    manager = MigrationManager(temp_migrations_dir, temp_db_repo / "v2")
+    runner = MigrationRunner(
+        publication_service=services["publication"],
+        search_service=services["search"],
+        scraping_service=services["scraping"],
+        db=services["db"],
+        migration_manager=manager,
+    )
+    runner._has_uncommitted_changes = lambda: False
+    runner._get_git_diff = lambda: None
+
+    migrations = await manager.discover_migrations()
+    results = await runner.run_migrations(migrations)
+
+    assert [r.status for r in results] == [
+        MigrationStatus.SKIPPED,
+        MigrationStatus.COMPLETED,
+    ]
+    assert "already applied" in results[0].logs[0]
+    assert "Second migration executed" in results[1].logs
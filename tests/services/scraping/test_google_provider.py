@@ -235,6 +235,101 @@ class TestGoogleVertexAIProviderStructuredExtraction:
             assert result["name"] == "Rabindra Mishra"
             assert result["role"] == "Politician"
 
+    @pytest.mark.asyncio
+    async def test_extract_structured_data_reuses_model(self):
+        """Test that repeated extractions share one model instance."""
+        with patch("vertexai.init"), patch(
+            "vertexai.generative_models.GenerativeModel"
+        ) as mock_model_class:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.text = json.dumps({"name": "Balen Shah"})
+            mock_response.usage_metadata = Mock(
+                prompt_token_count=5, candidates_token_count=5
+            )
+            mock_client.generate_content.return_value = mock_response
+            mock_model_class.return_value = mock_client
+
+            from nes.services.scraping.providers import GoogleVertexAIProvider
+
+            provider = GoogleVertexAIProvider(
+                project_id="test-project", enable_cache=False
+            )
+            schema = {"type": "object", "properties": {"name": {"type": "string"}}}
+
+            for text in ["Text 1", "Text 2", "Text 3"]:
+                await provider.extract_structured_data(
+                    text=text, schema=schema, instructions="Extract name"
+                )
+
+            # One model at init plus one for the extraction system instruction
+            assert mock_model_class.call_count == 2
+            assert mock_client.generate_content.call_count == 3
+
+            await provider.aclose()
+
+    @pytest.mark.asyncio
+    async def test_worker_pool_created_lazily_and_released(self):
+        """Test that the thread pool exists only between first use and close."""
+        import gc
+
+        with patch("vertexai.init"), patch(
+            "vertexai.generative_models.GenerativeModel"
+        ) as mock_model_class:
+            mock_client = Mock()
+            mock_response = Mock()
+            mock_response.text = "Translated"
+            mock_response.usage_metadata = Mock(
+                prompt_token_count=5, candidates_token_count=5
+            )
+            mock_client.start_chat.return_value.send_message.return_value = (
+                mock_response
+            )
+            mock_model_class.return_value = mock_client
+
+            from nes.services.scraping.providers import GoogleVertexAIProvider
+
+            provider = GoogleVertexAIProvider(
+                project_id="test-project", enable_cache=False
+            )
+            assert provider._executor is None
+
+            await provider.generate_text("Hello")
+            executor = provider._executor
+            assert executor is not None
+
+            # A provider that is never closed still shuts its pool down
+            del provider
+            gc.collect()
+            assert executor._shutdown
+
+    @pytest.mark.asyncio
+    async def test_rate_limit_spaces_concurrent_requests(self):
+        """Test that concurrent requests are spaced by the minimum interval."""
+        import asyncio
+        import time
+
+        with patch("vertexai.init"), patch(
+            "vertexai.generative_models.GenerativeModel"
+        ):
+            from nes.services.scraping.providers import GoogleVertexAIProvider
+
+            provider = GoogleVertexAIProvider(project_id="test-project")
+            provider._min_request_interval = 0.02
+
+            send_times = []
+
+            async def request():
+                await provider._rate_limit()
+                send_times.append(time.monotonic())
+
+            await asyncio.gather(*(request() for _ in range(5)))
+
+            gaps = [b - a for a, b in zip(send_times, send_times[1:])]
+            assert all(gap >= 0.015 for gap in gaps)
+
+            await provider.aclose()
+
 
 class TestGoogleVertexAIProviderTokenTracking:
     """Test token usage tracking."""
@@ -174,6 +174,40 @@ class TestPublicationServiceEntityCreation:
                 change_description="Test",
             )
 
+    @pytest.mark.asyncio
+    async def test_create_entity_accepts_model_instances(self, temp_db_path):
+        """Test that nested entity data may be given as model instances."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entity_data = {
+            "slug": "sher-bahadur-deuba",
+            "type": "person",
+            "names": [Name(kind=NameKind.PRIMARY, en={"full": "Sher Bahadur Deuba"})],
+        }
+
+        entity = await service.create_entity(
+            entity_data=entity_data,
+            author_id="author:system-importer",
+            change_description="Initial import",
+        )
+
+        retrieved = await db.get_entity(entity.id)
+        assert retrieved.names[0].en.full == "Sher Bahadur Deuba"
+
+        # Model instances without a PRIMARY name are still rejected
+        with pytest.raises(ValueError):
+            await service.create_entity(
+                entity_data={
+                    "slug": "some-name",
+                    "type": "person",
+                    "names": [Name(kind=NameKind.ALIAS, en={"full": "Some Name"})],
+                },
+                author_id="author:system-importer",
+            )
+
 
 class TestPublicationServiceEntityUpdates:
     """Test entity updates with version creation."""
@@ -697,6 +731,96 @@ class TestPublicationServiceCoordinatedOperations:
         assert len(results) == 3
         assert all(e.version_summary.version_number == 1 for e in results)
 
+    @pytest.mark.asyncio
+    async def test_batch_create_entities_rejects_duplicates(self, temp_db_path):
+        """Test batch creation refuses the same entity twice in one batch."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entity_data = {
+            "slug": "batch-dup",
+            "type": "person",
+            "names": [{"kind": "PRIMARY", "en": {"full": "Batch Dup"}}],
+        }
+
+        with pytest.raises(ValueError, match="Duplicate entity"):
+            await service.batch_create_entities(
+                entities_data=[entity_data, dict(entity_data)],
+                author_id="author:test",
+                change_description="Batch import",
+            )
+
+        assert await db.get_entity("entity:person/batch-dup") is None
+
+    @pytest.mark.asyncio
+    async def test_batch_update_entities(self, temp_db_path):
+        """Test batch update of multiple entities."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entities = await service.batch_create_entities(
+            entities_data=[
+                {
+                    "slug": f"batch-update-{i}",
+                    "type": "person",
+                    "names": [{"kind": "PRIMARY", "en": {"full": f"Batch {i}"}}],
+                }
+                for i in range(5)
+            ],
+            author_id="author:test",
+            change_description="Batch import",
+        )
+
+        for entity in entities:
+            entity.attributes = {"verified": True}
+
+        results = await service.batch_update_entities(
+            entities=entities,
+            author_id="author:test",
+            change_description="Batch verify",
+            max_concurrency=2,
+        )
+
+        assert [e.id for e in results] == [e.id for e in entities]
+        for entity in results:
+            stored = await db.get_entity(entity.id)
+            assert stored.attributes == {"verified": True}
+            assert stored.version_summary.version_number == 2
+            assert stored.version_summary.change_description == "Batch verify"
+
+    @pytest.mark.asyncio
+    async def test_batch_update_entities_rejects_duplicates(self, temp_db_path):
+        """Test batch update refuses the same entity twice in one batch."""
+        from nes.services.publication import PublicationService
+
+        db = FileDatabase(base_path=str(temp_db_path))
+        service = PublicationService(database=db)
+
+        entity = await service.create_entity(
+            entity_type=EntityType.PERSON,
+            entity_data={
+                "slug": "batch-update-dup",
+                "names": [{"kind": "PRIMARY", "en": {"full": "Batch Dup"}}],
+            },
+            author_id="author:test",
+            change_description="Initial import",
+        )
+        entity.attributes = {"verified": True}
+
+        with pytest.raises(ValueError, match="Duplicate entity"):
+            await service.batch_update_entities(
+                entities=[entity, entity],
+                author_id="author:test",
+                change_description="Batch verify",
+            )
+
+        stored = await db.get_entity(entity.id)
+        assert stored.version_summary.version_number == 1
+
 
 class TestPublicationServiceRollback:
     """Test rollback mechanisms for failed operations."""